@@ -144,6 +144,7 @@ class GianttSourceManager:
                 f.write("*.iml\n")
                 f.write("\n# Data / backup files\n")
                 f.write("*.backup\n")
+                f.write("*.backup.gz\n")
                 f.write("*.jsonl\n")
                 f.write("items.txt\n")
                 f.write("metadata.json\n")
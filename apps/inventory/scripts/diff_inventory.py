@@ -7,78 +7,219 @@ and comment lines (starting with #).
 
 Usage:
     python diff_invs.py old.txt new.txt
+
+Set SORADYNE_DIFF_CACHE=1 to cache each file's parse next to it (as
+<file>.diffcache), reused while the file's mtime and size are unchanged.
 """
 
 import json
+import os
+import pickle
 import re
 import sys
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# Matches every non-blank, non-comment line of a file in one pass. Lines in
+# the entry format fill group 1 (the stripped line) and its fields in groups
+# 2-4; anything else lands in group 5 so it can be reported as unparseable.
+# [^\S\n] is "whitespace other than newline", which keeps each match on a
+# single line.
+ENTRY_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"((\{.*?\})[^\S\n]+(.*?)[^\S\n]+->[^\S\n]+(\S.*?))"
+    r"|(?!#)(\S.*?)"
+    r")[^\S\n]*$",
+    re.M,
+)
 
-ENTRY_RE = re.compile(r"^(\{.*?\})\s+(.*?)\s+->\s+(.*)$")
+# Fast path for the metadata brace in the shape the app writes it:
+# {"category": "...", "tags": ["...", ...]} with no escapes in any string.
+# Anything else (other key order, extra keys, escapes) goes through json.
+_WS = r"[ \t]*"
+_STR = r'"[^"\\\x00-\x1f]*"'
+META_RE = re.compile(
+    rf'\{{{_WS}"category"{_WS}:{_WS}"([^"\\\x00-\x1f]*)"{_WS},'
+    rf'{_WS}"tags"{_WS}:{_WS}\[{_WS}((?:{_STR}(?:{_WS},{_WS}{_STR})*)?){_WS}\]{_WS}\}}'
+)
+TAG_RE = re.compile(r'"([^"]*)"')
 
 
-@dataclass
+@dataclass(slots=True)
 class Entry:
     category: str
-    tags: list[str]
+    tag_mask: int  # bit i set for each tag with id i in the shared TagVocab
     description: str
     location: str
     line: str  # original line for display
+    key: str  # lowercased description, used to match entries across files
+    fp: int | None  # hash of the compared fields; equal fps mean nothing to report
 
-    @property
-    def key(self) -> str:
-        return self.description.strip().lower()
 
+@dataclass(slots=True)
+class TagVocab:
+    """Tag <-> bit index assignment shared by both files being diffed, so
+    tag sets become ints and comparing them is a few integer ops. Safe to
+    share between the threads parsing each file."""
+    ids: dict[str, int] = field(default_factory=dict)
+    names: list[str] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
 
-def parse_file(path: str) -> dict[str, Entry]:
-    entries: dict[str, Entry] = {}
-    with open(path) as f:
-        for lineno, raw in enumerate(f, 1):
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            m = ENTRY_RE.match(line)
-            if not m:
-                print(f"  warning: skipping unparseable line {lineno}: {line[:80]}", file=sys.stderr)
-                continue
-            meta_str, desc, loc = m.group(1), m.group(2), m.group(3)
+    def mask(self, tags) -> int:
+        ids, names = self.ids, self.names
+        m = 0
+        for t in tags:
+            i = ids.get(t)
+            if i is None:
+                with self.lock:
+                    i = ids.get(t)
+                    if i is None:
+                        i = len(names)
+                        names.append(t)
+                        ids[t] = i
+            m |= 1 << i
+        return m
+
+    def decode(self, mask: int) -> list[str]:
+        names = self.names
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(names[low.bit_length() - 1])
+            mask ^= low
+        out.sort()
+        return out
+
+
+# (key, category, tags, description, location, line) for one parsed line.
+# Unlike Entry this does not depend on a TagVocab or the process hash seed,
+# so it is what gets cached on disk.
+Record = tuple[str, str, list[str], str, str, str]
+
+CACHE_ENV = "SORADYNE_DIFF_CACHE"
+CACHE_VERSION = 1
+
+
+def scan_text(data: str) -> tuple[list[Record], list[str]]:
+    """Tokenize a whole file's text into records plus warning lines
+    (newline-terminated) for unparseable, bad-JSON, and duplicate lines."""
+    records: list[Record] = []
+    warnings: list[str] = []
+    seen: set[str] = set()
+
+    # Line numbers are only needed for warnings, so count newlines lazily
+    # from the last position we resolved rather than tracking every line.
+    line_pos, line_no = 0, 1
+
+    def lineno_at(pos: int) -> int:
+        nonlocal line_pos, line_no
+        line_no += data.count("\n", line_pos, pos)
+        line_pos = pos
+        return line_no
+
+    # Hot loop: the regex engine does the tokenizing; keep the per-entry
+    # Python work to local lookups.
+    meta_match = META_RE.fullmatch
+    tag_findall = TAG_RE.findall
+    seen_add = seen.add
+    for m in ENTRY_RE.finditer(data):
+        line, meta_str, desc, loc, junk = m.groups()
+        if junk is not None:
+            warnings.append(f"  warning: skipping unparseable line {lineno_at(m.start())}: {junk[:80]}\n")
+            continue
+        mm = meta_match(meta_str)
+        if mm is not None:
+            category, tags = mm.group(1), tag_findall(mm.group(2))
+        else:
             try:
                 meta = json.loads(meta_str)
             except json.JSONDecodeError:
-                print(f"  warning: bad JSON on line {lineno}: {meta_str[:80]}", file=sys.stderr)
+                warnings.append(f"  warning: bad JSON on line {lineno_at(m.start())}: {meta_str[:80]}\n")
                 continue
-            entry = Entry(
-                category=meta.get("category", ""),
-                tags=sorted(meta.get("tags", [])),
-                description=desc,
-                location=loc,
-                line=line,
-            )
-            key = entry.key
-            if key in entries:
-                print(f"  warning: duplicate description on line {lineno}: {desc[:60]}", file=sys.stderr)
-            entries[key] = entry
-    return entries
-
-
-def diff_fields(old: Entry, new: Entry) -> list[str]:
+            category, tags = meta.get("category", ""), meta.get("tags", [])
+        # ENTRY_RE never captures surrounding whitespace in desc, so there is
+        # nothing to strip before lowercasing for the key.
+        key = desc.lower()
+        # One hash probe per line: a duplicate is an add that doesn't grow seen.
+        n_seen = len(seen)
+        seen_add(key)
+        if len(seen) == n_seen:
+            warnings.append(f"  warning: duplicate description on line {lineno_at(m.start())}: {desc[:60]}\n")
+        records.append((key, category, tags, desc, loc, line))
+    return records, warnings
+
+
+def load_records(path: str) -> tuple[list[Record], list[str]]:
+    """scan_text() for a file, going through the on-disk cache when enabled."""
+    if os.environ.get(CACHE_ENV) != "1":
+        with open(path) as f:
+            return scan_text(f.read())
+
+    cache_path = f"{path}.diffcache"
+    st = os.stat(path)
+    stamp = (CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, result = pickle.load(f)
+        if cached_stamp == stamp:
+            return result
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    with open(path) as f:
+        result = scan_text(f.read())
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return result
+
+
+def parse_file(path: str, vocab: TagVocab) -> tuple[dict[str, Entry], list[str]]:
+    """Parse one inventory file, returning its entries by key and any
+    warning lines (newline-terminated) for the caller to report."""
+    records, warnings = load_records(path)
+    entries: dict[str, Entry] = {}
+    tag_mask = vocab.mask
+    intern = sys.intern
+    for key, category, tags, desc, loc, line in records:
+        # Categories and locations come from a small vocabulary; interning
+        # shares one string per value and lets equality hit the identity check.
+        if isinstance(category, str):
+            category = intern(category)
+        loc = intern(loc)
+        mask = tag_mask(tags)
+        # A category that isn't a JSON string may not hash; such entries
+        # get no fingerprint and are always compared field by field.
+        try:
+            fp = hash((category, mask, desc, loc))
+        except TypeError:
+            fp = None
+        entries[key] = Entry(category, mask, desc, loc, line, key, fp)
+    return entries, warnings
+
+
+def diff_fields(old: Entry, new: Entry, vocab: TagVocab) -> str | None:
+    """Return the report block for the fields that differ (one indented line
+    per field), or None if nothing differs."""
     changes = []
     if old.category != new.category:
-        changes.append(f"  category: {old.category!r} -> {new.category!r}")
+        changes.append(f"      category: {old.category!r} -> {new.category!r}")
     if old.location != new.location:
-        changes.append(f"  location: {old.location!r} -> {new.location!r}")
-    if old.tags != new.tags:
-        removed_tags = set(old.tags) - set(new.tags)
-        added_tags = set(new.tags) - set(old.tags)
+        changes.append(f"      location: {old.location!r} -> {new.location!r}")
+    changed_tags = old.tag_mask ^ new.tag_mask
+    if changed_tags:
         parts = []
-        if removed_tags:
-            parts.append(f"-[{', '.join(sorted(removed_tags))}]")
-        if added_tags:
-            parts.append(f"+[{', '.join(sorted(added_tags))}]")
-        changes.append(f"  tags: {' '.join(parts)}")
+        if removed_tags := changed_tags & old.tag_mask:
+            parts.append(f"-[{', '.join(vocab.decode(removed_tags))}]")
+        if added_tags := changed_tags & new.tag_mask:
+            parts.append(f"+[{', '.join(vocab.decode(added_tags))}]")
+        changes.append(f"      tags: {' '.join(parts)}")
     if old.description != new.description:
-        changes.append(f"  description: {old.description!r} -> {new.description!r}")
-    return changes
+        changes.append(f"      description: {old.description!r} -> {new.description!r}")
+    return "\n".join(changes) if changes else None
 
 
 def main():
@@ -87,50 +228,76 @@ def main():
         sys.exit(1)
 
     old_path, new_path = sys.argv[1], sys.argv[2]
-    old = parse_file(old_path)
-    new = parse_file(new_path)
+    vocab = TagVocab()
+    # Overlap reading/parsing the two files; warnings are still written in
+    # file order afterwards.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_old = ex.submit(parse_file, old_path, vocab)
+        fut_new = ex.submit(parse_file, new_path, vocab)
+        old, old_warnings = fut_old.result()
+        new, new_warnings = fut_new.result()
+    sys.stderr.writelines(old_warnings)
+    sys.stderr.writelines(new_warnings)
+
+    old_keys = old.keys()
+    new_keys = new.keys()
 
-    old_keys = set(old)
-    new_keys = set(new)
+    # Intersect from the smaller side, then subtract the (small) common set
+    # from each side, so a large file paired with a small one never has its
+    # keys probed against the other file as a whole.
+    if len(old_keys) <= len(new_keys):
+        common_keys = old_keys & new_keys
+    else:
+        common_keys = new_keys & old_keys
+    removed_keys = old_keys - common_keys
+    added_keys = new_keys - common_keys
 
-    removed = sorted(old_keys - new_keys, key=lambda k: old[k].description)
-    added = sorted(new_keys - old_keys, key=lambda k: new[k].description)
-    common = sorted(old_keys & new_keys, key=lambda k: old[k].description)
+    # Sort (description, key) pairs so ordering is decided by C-level tuple
+    # comparison rather than a Python key function per element.
+    removed = [k for _, k in sorted((old[k].description, k) for k in removed_keys)]
+    added = [k for _, k in sorted((new[k].description, k) for k in added_keys)]
+    common = [k for _, k in sorted((old[k].description, k) for k in common_keys)]
 
     changed = []
     for key in common:
-        fields = diff_fields(old[key], new[key])
-        if fields:
-            changed.append((old[key].description, fields))
+        o, n = old[key], new[key]
+        # Most common entries are untouched; hashes are seeded per process,
+        # so fingerprints from both files are comparable.
+        if o.fp is not None and o.fp == n.fp:
+            continue
+        block = diff_fields(o, n, vocab)
+        if block is not None:
+            changed.append((o.description, block))
 
-    # Print report
+    # Build the report in memory and emit it with a single write
     if not removed and not added and not changed:
         print("No differences found.")
         return
 
+    out: list[str] = []
     if removed:
-        print(f"REMOVED ({len(removed)}):")
+        out.append(f"REMOVED ({len(removed)}):")
         for key in removed:
             e = old[key]
-            print(f"  - {e.description}  [{e.category}] -> {e.location}")
-        print()
+            out.append(f"  - {e.description}  [{e.category}] -> {e.location}")
+        out.append("")
 
     if added:
-        print(f"ADDED ({len(added)}):")
+        out.append(f"ADDED ({len(added)}):")
         for key in added:
             e = new[key]
-            print(f"  + {e.description}  [{e.category}] -> {e.location}")
-        print()
+            out.append(f"  + {e.description}  [{e.category}] -> {e.location}")
+        out.append("")
 
     if changed:
-        print(f"CHANGED ({len(changed)}):")
-        for desc, fields in changed:
-            print(f"  ~ {desc}")
-            for f in fields:
-                print(f"    {f}")
-        print()
-
-    print(f"Summary: {len(removed)} removed, {len(added)} added, {len(changed)} changed, {len(common) - len(changed)} unchanged")
+        out.append(f"CHANGED ({len(changed)}):")
+        for desc, block in changed:
+            out.append(f"  ~ {desc}\n{block}")
+        out.append("")
+
+    out.append(f"Summary: {len(removed)} removed, {len(added)} added, {len(changed)} changed, {len(common) - len(changed)} unchanged")
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+"""Tests for diff_inventory. Run with: python -m unittest test_diff_inventory"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import diff_inventory
+
+
+def run_diff(old_text: str, new_text: str) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, text in (("old.txt", old_text), ("new.txt", new_text)):
+            path = os.path.join(tmp, name)
+            with open(path, "w") as f:
+                f.write(text)
+            paths.append(path)
+        out = io.StringIO()
+        argv = sys.argv
+        sys.argv = ["diff_inventory.py", *paths]
+        try:
+            with contextlib.redirect_stdout(out):
+                diff_inventory.main()
+        finally:
+            sys.argv = argv
+    return out.getvalue()
+
+
+class NonStringCategoryTest(unittest.TestCase):
+    def test_list_category_change_is_reported(self):
+        out = run_diff('{"category": ["a"], "tags": []} widget -> shelf\n',
+                       '{"category": ["b"], "tags": []} widget -> shelf\n')
+        self.assertIn("category: ['a'] -> ['b']", out)
+        self.assertIn("1 changed, 0 unchanged", out)
+
+    def test_unchanged_list_category(self):
+        line = '{"category": ["a"], "tags": []} widget -> shelf\n'
+        self.assertEqual(run_diff(line, line), "No differences found.\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
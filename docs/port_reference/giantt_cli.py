@@ -1,22 +1,52 @@
 from typing import List, Dict, Tuple, Optional, Set
 import click
+import functools
+import gzip
+import hashlib
 import shutil
 import tempfile
 from pathlib import Path
 import re
 import json
+import mmap
 import os
+import pickle
 
 from giantt_core import (
     GianttGraph, GianttItem, RelationType,
     Status, Priority, Duration,
     LogEntry, LogCollection,
     Issue, IssueType, GianttDoctor,
-    CycleDetectedException
+    CycleDetectedException, json_loads
 )
 
+# blake2b digest of each items file's contents as last loaded or saved, so
+# saves can skip backing up and rewriting files whose contents are unchanged
+_file_digests: Dict[str, bytes] = {}
+
+# A stripped line of an items or logs file that is neither blank nor a
+# comment, so loaders can pick out content lines in one pass over the text
+CONTENT_LINE_RE = re.compile(r'^[^\S\n]*([^#\s][^\n]*?)[^\S\n]*$', re.MULTILINE)
+
+# Parsed contents of each items file, keyed by (path, mtime_ns, size), so
+# repeated loads of an unchanged file within one process skip the read and
+# parse. Values are (digest, include directives, items, warnings); the cached
+# items are never handed out directly, only copies of them
+_parsed_files: Dict[Tuple[str, int, int], Tuple[bytes, List[str], List[GianttItem], List[str]]] = {}
+
+# Bump when the parsed form of items changes, so older snapshots are ignored
+SNAPSHOT_VERSION = 3
+
+# Threads used by clean to run its backup moves concurrently
+CLEAN_WORKERS = 8
+
+@functools.lru_cache(maxsize=None)
 def get_default_giantt_path(filename: str = 'items.txt', occlude: bool = False) -> str:
-    """Get the default path for Giantt files."""
+    """Get the default path for Giantt files.
+
+    Results are cached for the life of the process, since commands ask for
+    the same few paths repeatedly and each lookup costs up to two stats.
+    """
     # whether it's the occlude or include directory
     filepath = Path('occlude' if occlude else 'include') / filename
     # First check for local .giantt directory
@@ -32,24 +62,103 @@ def get_default_giantt_path(filename: str = 'items.txt', occlude: bool = False)
     # If neither exists, raise an error
     raise click.ClickException(f"No Giantt {filepath} found. Please run 'giantt init' or 'giantt init --dev' first.")
 
+def resolve_items_paths(file: Optional[str], occlude_file: Optional[str]) -> Tuple[str, str]:
+    """Fill in the default include and occlude items files where not given."""
+    return (file or get_default_giantt_path(),
+            occlude_file or get_default_giantt_path(occlude=True))
+
+def resolve_logs_paths(log_file: Optional[str], occlude_log_file: Optional[str]) -> Tuple[str, str]:
+    """Fill in the default include and occlude logs files where not given."""
+    return (log_file or get_default_giantt_path('logs.jsonl'),
+            occlude_log_file or get_default_giantt_path('logs.jsonl', occlude=True))
+
+def is_occlude_path(filepath: str) -> bool:
+    """Whether a file lives under an occlude directory."""
+    # Match a whole path component, so e.g. ~/occlude-notes/.giantt/include
+    # is not mistaken for an occlude directory
+    return 'occlude' in Path(filepath).parts
+
+# Backups are gzip-compressed; older uncompressed backups are still counted
+# when numbering and cleaning up
+BACKUP_SUFFIX = '.backup.gz'
+BACKUP_SUFFIXES = ('.backup', '.backup.gz')
+
+def latest_backup(filepath: str) -> Tuple[int, Optional[str]]:
+    """Get the highest N among a file's backups and that backup's path.
+
+    Returns (0, None) if the file has no backups.
+    """
+    # One directory scan keeping the highest number seen, rather than probing
+    # or sorting candidate names
+    directory = os.path.dirname(filepath)
+    prefix = os.path.basename(filepath) + '.'
+    highest, latest = 0, None
+    with os.scandir(directory or '.') as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(prefix):
+                continue
+            for suffix in BACKUP_SUFFIXES:
+                if name.endswith(suffix):
+                    backup_num = name[len(prefix):-len(suffix)]
+                    if backup_num.isdigit() and int(backup_num) > highest:
+                        highest, latest = int(backup_num), os.path.join(directory, name)
+    return highest, latest
+
 def increment_backup_name(filepath: str) -> str:
     """Increment the backup name for a file."""
-    backup_num = 1
-    while True:
-        backup_path = f"{filepath}.{backup_num}.backup"
-        if not os.path.exists(backup_path):
-            return backup_path
-        backup_num += 1
-
-def most_recent_backup_name(filepath: str) -> str:
+    return f"{filepath}.{latest_backup(filepath)[0] + 1}{BACKUP_SUFFIX}"
+
+def backup_file(filepath: str) -> str:
+    """Copy a file to its next numbered, compressed backup and return the backup's path."""
+    backup_path = increment_backup_name(filepath)
+    # Fastest compression level: text items and logs still shrink several
+    # times over, for little more CPU than a plain copy
+    with open(filepath, 'rb') as src, gzip.open(backup_path, 'wb', compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+    return backup_path
+
+def write_file_synced(filepath: str, data: bytes) -> None:
+    """Write bytes to a file and flush them to disk before returning."""
+    with open(filepath, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+def fsync_directory(dirpath: str) -> None:
+    """Flush a directory's entries to disk, so renames into it survive a crash."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Directories can't be opened for fsync on this platform
+    fd = os.open(dirpath or '.', os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def most_recent_backup_name(filepath: str) -> Optional[str]:
     """Get the most recent backup name for a file."""
-    # get list of backups by listing the directory
-    backups = os.listdir(os.path.dirname(filepath))
-    # sort key that gets the number in the backup name as an integer
-    key = lambda x: int(x.split('.')[-2]) if x.endswith('.backup') else 0
-    for backup in reversed(sorted(backups, key=key)):
-        if backup.startswith(f"{os.path.basename(filepath)}.") and backup.endswith(".backup"):
-            return os.path.join(os.path.dirname(filepath), backup)
+    return latest_backup(filepath)[1]
+
+def parse_include_directives_from_bytes(data) -> List[str]:
+    """Parse include directives from the start of a file's raw contents.
+
+    Accepts bytes or an mmap. Scanning stops at the first line that is not
+    an include directive, so the rest of the file is never touched.
+    """
+    includes = []
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b'\n', start)
+        if end == -1:
+            end = size
+        line = data[start:end].strip()
+        if not line.startswith(b'#include '):
+            break  # Only process directives at the top
+        include_path = line[9:].strip()  # Remove '#include ' prefix
+        includes.append(include_path.decode('utf-8'))
+        start = end + 1
+    return includes
 
 def parse_include_directives(filepath: str) -> List[str]:
     """Parse include directives from a file.
@@ -60,18 +169,76 @@ def parse_include_directives(filepath: str) -> List[str]:
     Returns:
         List of file paths to include
     """
-    includes = []
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or not line.startswith('#include '):
-                    break  # Only process directives at the top
-                include_path = line[9:].strip()  # Remove '#include ' prefix
-                includes.append(include_path)
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []  # Empty files can't be mapped
+            # Map the file so only the pages holding the directives are read
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return parse_include_directives_from_bytes(mm)
     except FileNotFoundError:
         click.echo(f"Warning: Include file not found: {filepath}", err=True)
-    return includes
+    return []
+
+def snapshots_enabled() -> bool:
+    """Whether parsed items files are snapshotted, set by GIANTT_SNAPSHOTS=1.
+
+    Off by default: every save invalidates a file's snapshot, so only
+    read-heavy use of large files gains from them.
+    """
+    return os.environ.get('GIANTT_SNAPSHOTS') == '1'
+
+def snapshot_dir() -> Path:
+    """Get the private per-user directory snapshots are kept in.
+
+    Snapshots are pickles, so they live in the user's cache directory rather
+    than next to the items files, where synced or shared data could be
+    swapped for a pickle that runs code when loaded.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(cache_home) / 'giantt' / 'snapshots'
+
+def snapshot_path(filepath: str) -> Path:
+    """Get the snapshot file for an items file, named by a hash of its path."""
+    name = hashlib.blake2b(os.path.abspath(filepath).encode('utf-8'), digest_size=16).hexdigest()
+    return snapshot_dir() / f"{name}.pickle"
+
+def load_items_snapshot(filepath: str, digest: bytes):
+    """Load the parsed contents of an items file from its snapshot.
+
+    Snapshots are only used if they were made from contents with the given
+    digest, and only from a directory owned by and writable only by the
+    current user. Returns None if there is no usable snapshot.
+    """
+    path = snapshot_path(filepath)
+    try:
+        st = os.stat(path.parent)
+        if (hasattr(os, 'getuid') and st.st_uid != os.getuid()) or st.st_mode & 0o022:
+            return None
+        with open(path, 'rb') as f:
+            version, parsed = pickle.load(f)
+    # Missing or unreadable, or corrupt or from an incompatible version
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError, TypeError):
+        return None
+    if version != SNAPSHOT_VERSION or parsed[0] != digest:
+        return None
+    return parsed
+
+def save_items_snapshot(filepath: str, parsed) -> None:
+    """Save the parsed contents of an items file as a snapshot."""
+    path = snapshot_path(filepath)
+    temp_path = path.with_name(path.name + '.temp')
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump((SNAPSHOT_VERSION, parsed), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except (OSError, pickle.PicklingError):
+        # The snapshot is only a speedup, so failing to write one is fine
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
 def load_graph_from_file(filepath: str, loaded_files: Optional[Set[str]] = None) -> GianttGraph:
     """Load a graph from a file, processing include directives.
@@ -93,15 +260,30 @@ def load_graph_from_file(filepath: str, loaded_files: Optional[Set[str]] = None)
     
     loaded_files.add(filepath)
     
-    # Create a backup of the file first if it exists
-    if os.path.exists(filepath):
-        shutil.copyfile(filepath, increment_backup_name(filepath))
-    else:
+    # Read the file once; its digest lets save_graph_files skip unchanged files
+    # (backups are made there, only for files that are actually rewritten)
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
         click.echo(f"Warning: File not found: {filepath}, skipping", err=True)
         return GianttGraph()
-    
-    # Process include directives
-    includes = parse_include_directives(filepath)
+    cache_key = (filepath, st.st_mtime_ns, st.st_size)
+    cached = _parsed_files.get(cache_key)
+    if cached is None:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        digest = hashlib.blake2b(data).digest()
+        # A snapshot of these exact contents saves parsing them again
+        if snapshots_enabled():
+            cached = load_items_snapshot(filepath, digest)
+            if cached is not None:
+                _parsed_files[cache_key] = cached
+    if cached is not None:
+        digest, includes, items, warnings = cached
+    else:
+        # Process include directives from the contents already in hand
+        includes = parse_include_directives_from_bytes(data)
+    _file_digests[filepath] = digest
     
     # Create the graph
     graph = GianttGraph()
@@ -115,42 +297,58 @@ def load_graph_from_file(filepath: str, loaded_files: Optional[Set[str]] = None)
         
         try:
             include_graph = load_graph_from_file(include_path, loaded_files)
-            graph = graph + include_graph
+            graph += include_graph
         except Exception as e:
             click.echo(f"Warning: Error loading include {include_path}: {e}", err=True)
     
     # Now load the main file
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                try:
-                    item = GianttItem.from_string(line, occlude='occlude' in filepath)
-                    graph.add_item(item)
-                except ValueError as e:
-                    click.echo(f"Warning: Skipping invalid line: {e}", err=True)
+    if cached is None:
+        items = []
+        warnings = []
+        occlude = is_occlude_path(filepath)
+        from_string = GianttItem.from_string
+        append = items.append
+        for line in CONTENT_LINE_RE.findall(data.decode('utf-8')):
+            try:
+                append(from_string(line, occlude=occlude))
+            except ValueError as e:
+                warnings.append(f"Warning: Skipping invalid line: {e}")
+                click.echo(warnings[-1], err=True)
+        cached = _parsed_files[cache_key] = (digest, includes, items, warnings)
+        if snapshots_enabled():
+            save_items_snapshot(filepath, cached)
+    else:
+        # Repeat the warnings from when the contents were first parsed
+        for message in warnings:
+            click.echo(message, err=True)
+    for item in items:
+        graph.add_item(item.copy())
     
     return graph
 
 def load_logs_from_file(filepath: str) -> LogCollection:
-    # create a backup of the file first
-    shutil.copyfile(filepath, increment_backup_name(filepath))
     logs = LogCollection()
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                try:
-                    log = LogEntry.from_line(line, occlude='occlude' in filepath)
-                    logs.add_entry(log)
-                except json.JSONDecodeError as e:
-                    click.echo(f"Warning: Skipping invalid log line: {e}", err=True)
+    # Read and decode the whole file in one go rather than line by line;
+    # its digest lets save_log_files skip (and not back up) unchanged files
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    _file_digests[filepath] = hashlib.blake2b(data).digest()
+    occlude = is_occlude_path(filepath)
+    from_dict = LogEntry.from_dict
+    add_entry = logs.add_entry
+    for line in CONTENT_LINE_RE.findall(data.decode('utf-8')):
+        try:
+            add_entry(from_dict(json_loads(line), occlude=occlude))
+        except json.JSONDecodeError as e:
+            click.echo(f"Warning: Skipping invalid log line: {e}", err=True)
     return logs
 
 def load_graph(filepath: str, occlude_filepath: str) -> GianttGraph:
     """Load a graph from main and occluded files, processing includes."""
     loaded_files = set()
-    return load_graph_from_file(filepath, loaded_files) + load_graph_from_file(occlude_filepath, loaded_files)
+    graph = load_graph_from_file(filepath, loaded_files)
+    graph += load_graph_from_file(occlude_filepath, loaded_files)
+    return graph
 
 def load_logs(filepath: str, occlude_filepath: str) -> LogCollection:
     logs = load_logs_from_file(filepath)
@@ -167,28 +365,23 @@ def create_banner(text: str, padding_h: int = 5, padding_v: int = 1):
     max_length = max(len(line) for line in lines)
     banner_len = max_length + 2 * padding_h  # Account for horizontal padding
     top_bottom_border = "#" * (banner_len + 2)  # Add border around text
-
-    banner = top_bottom_border + "\n"
-
-    # Add vertical padding lines
     empty_line = "#" + " " * banner_len + "#"
-    for _ in range(padding_v):
-        banner += empty_line + "\n"
+    side = " " * padding_h
 
+    # Collect the lines and join once at the end
+    parts = [top_bottom_border]
+    # Add vertical padding lines
+    parts.extend([empty_line] * padding_v)
     # Add text lines, centered
     for line in lines:
         padding = max_length - len(line)
         left_padding = padding // 2
         right_padding = padding - left_padding
-        banner += f"#{' ' * padding_h}{' ' * left_padding}{line}{' ' * right_padding}{' ' * padding_h}#\n"
+        parts.append(f"#{side}{' ' * left_padding}{line}{' ' * right_padding}{side}#")
+    parts.extend([empty_line] * padding_v)
+    parts.append(top_bottom_border)
 
-    # Add vertical padding lines
-    for _ in range(padding_v):
-        banner += empty_line + "\n"
-
-    banner += top_bottom_border + "\n"
-
-    return banner
+    return "\n".join(parts) + "\n"
 
 ITEMS_FILE_BANNER = (
     create_banner(
@@ -210,7 +403,7 @@ ITEMS_ARCHIVE_FILE_BANNER = (
     )
 )
 
-def save_graph_files(filepath: str, occlude_filepath: str, graph: GianttGraph):
+def save_graph_files(filepath: str, occlude_filepath: str, graph: GianttGraph, check: bool = True) -> List[str]:
     """
     Safely saves all graph items, split appropriately between
     include and occlude files, by first performing a sort in memory
@@ -221,49 +414,61 @@ def save_graph_files(filepath: str, occlude_filepath: str, graph: GianttGraph):
         filepath: Path to the items file to save
         occlude_filepath: Path to the occluded items file to save
         graph: GianttGraph object containing items to save
+        check: Whether to run a quick health check after saving. Callers
+            that only change fields the check doesn't look at (status,
+            priority, title, ...) can pass False to skip it
+
+    Returns:
+        Paths of the files that were rewritten; files whose contents
+        would not change are left alone
 
     Raises:
         CycleDetectedException: If dependencies contain a cycle
         ValueError: If dependencies reference non-existent items
     """
+    # Temporary files
+    temp_include = filepath + '.temp'
+    temp_occlude = occlude_filepath + '.temp'
+
     try:
         # First perform the sort in memory to check for issues
         sorted_items = graph.topological_sort()
 
-        # Create temporary files
-        temp_include = filepath + '.temp'
-        temp_occlude = occlude_filepath + '.temp'
-
-        # Write to temporary files
-        with open(temp_include, "w") as f:
-            f.write(ITEMS_FILE_BANNER + "\n")
-            for item in sorted_items:
-                if not item.occlude:
-                    f.write(item.to_string() + "\n")
-
-        with open(temp_occlude, "w") as f:
-            f.write(ITEMS_ARCHIVE_FILE_BANNER + "\n")
-            for item in sorted_items:
-                if item.occlude:
-                    f.write(item.to_string() + "\n")
-
-        # If we get here, both writes succeeded, so rename temp files
-        os.replace(temp_include, filepath)
-        os.replace(temp_occlude, occlude_filepath)
-
-        # If most recent backup is identical to the new file, remove it
-        for backed_up_file in [filepath, occlude_filepath]:
-            most_recent_backup = most_recent_backup_name(backed_up_file)
-            if most_recent_backup:
-                with open(backed_up_file, 'r') as f:
-                    new_contents = f.read()
-                with open(most_recent_backup, 'r') as f:
-                    old_contents = f.read()
-                if new_contents == old_contents:
-                    os.remove(most_recent_backup)
+        # Split into include and occlude items in a single pass
+        include_items, occlude_items = [], []
+        for item in sorted_items:
+            (occlude_items if item.occlude else include_items).append(item)
+
+        # Serialize each file in memory so it goes to disk in one write
+        include_body = ITEMS_FILE_BANNER + "\n" + "".join(item.to_string() + "\n" for item in include_items)
+        occlude_body = ITEMS_ARCHIVE_FILE_BANNER + "\n" + "".join(item.to_string() + "\n" for item in occlude_items)
+
+        # Write temporary files only for files whose contents change
+        pending = []
+        for path, temp_path, body in [(filepath, temp_include, include_body),
+                                      (occlude_filepath, temp_occlude, occlude_body)]:
+            data = body.encode('utf-8')
+            digest = hashlib.blake2b(data).digest()
+            if _file_digests.get(path) == digest:
+                continue
+            write_file_synced(temp_path, data)
+            pending.append((path, temp_path, digest))
+
+        # If we get here, all writes succeeded, so back up the old
+        # contents and rename temp files
+        for path, temp_path, digest in pending:
+            if os.path.exists(path):
+                backup_file(path)
+            os.replace(temp_path, path)
+            _file_digests[path] = digest
+        for dirpath in {os.path.dirname(path) for path, _, _ in pending}:
+            fsync_directory(dirpath)
 
         # Run a quick health check
-        run_quick_check(graph)
+        if check:
+            run_quick_check(graph)
+
+        return [path for path, _, _ in pending]
 
     except (CycleDetectedException, ValueError) as e:
         # Clean up temp files if they exist
@@ -274,7 +479,7 @@ def save_graph_files(filepath: str, occlude_filepath: str, graph: GianttGraph):
                 pass
         raise click.ClickException(str(e))
 
-def save_log_files(filepath: str, occlude_filepath: str, logs: LogCollection):
+def save_log_files(filepath: str, occlude_filepath: str, logs: LogCollection) -> List[str]:
     """
     Safely saves all log entries, split appropriately between
     include and occlude files, with transaction-like behavior.
@@ -283,38 +488,45 @@ def save_log_files(filepath: str, occlude_filepath: str, logs: LogCollection):
         filepath: Path to the logs file to save
         occlude_filepath: Path to the occlude logs file to save
         logs: LogCollection object containing entries to save
+
+    Returns:
+        Paths of the files that were rewritten; files whose contents
+        would not change are left alone
     """
+    # Temporary files
+    temp_include = filepath + '.temp'
+    temp_occlude = occlude_filepath + '.temp'
+
     try:
-        # Create temporary files
-        temp_include = filepath + '.temp'
-        temp_occlude = occlude_filepath + '.temp'
-
-        # Write include logs to temporary file
-        with open(temp_include, 'w') as f:
-            for log in logs:
-                if not log.occlude:
-                    f.write(log.to_line() + '\n')
-
-        # Write occluded logs to temporary file
-        with open(temp_occlude, 'w') as f:
-            for log in logs:
-                if log.occlude:
-                    f.write(log.to_line() + '\n')
-
-        # If we get here, both writes succeeded, so rename temp files
-        os.replace(temp_include, filepath)
-        os.replace(temp_occlude, occlude_filepath)
-
-        # If most recent backup is identical to the new file, remove it
-        for backed_up_file in [filepath, occlude_filepath]:
-            most_recent_backup = most_recent_backup_name(backed_up_file)
-            if most_recent_backup:
-                with open(backed_up_file, 'r') as f:
-                    new_contents = f.read()
-                with open(most_recent_backup, 'r') as f:
-                    old_contents = f.read()
-                if new_contents == old_contents:
-                    os.remove(most_recent_backup)
+        # Split in a single pass, then join each file's lines once so it goes
+        # to disk in one write
+        included, occluded = logs.partition_by_occlude()
+        include_body = ''.join(log.to_line() + '\n' for log in included)
+        occlude_body = ''.join(log.to_line() + '\n' for log in occluded)
+
+        # Write temporary files only for files whose contents change, hashing
+        # the bytes being written rather than reading the files back afterwards
+        pending = []
+        for path, temp_path, body in [(filepath, temp_include, include_body),
+                                      (occlude_filepath, temp_occlude, occlude_body)]:
+            data = body.encode('utf-8')
+            digest = hashlib.blake2b(data).digest()
+            if _file_digests.get(path) == digest:
+                continue
+            write_file_synced(temp_path, data)
+            pending.append((path, temp_path, digest))
+
+        # If we get here, all writes succeeded, so back up the old
+        # contents and rename temp files
+        for path, temp_path, digest in pending:
+            if os.path.exists(path):
+                backup_file(path)
+            os.replace(temp_path, path)
+            _file_digests[path] = digest
+        for dirpath in {os.path.dirname(path) for path, _, _ in pending}:
+            fsync_directory(dirpath)
+
+        return [path for path, _, _ in pending]
 
     except Exception as e:
         # Clean up temp files if they exist
@@ -325,6 +537,96 @@ def save_log_files(filepath: str, occlude_filepath: str, logs: LogCollection):
                 pass
         raise click.ClickException(f"Error saving log files: {str(e)}")
 
+def occlude_log_lines(filepath: str, occlude_filepath: str, identifiers: Set[str],
+                      tags: Set[str], dry_run: bool = False) -> List[LogEntry]:
+    """
+    Moves include log entries whose session is one of identifiers, or that
+    have any of tags, to the end of the occlude logs file.
+
+    Works on the raw lines of the include file, so entries that stay are
+    copied through untouched and neither file is loaded or reserialized in
+    full. Both files are backed up and replaced with the same transaction-like
+    write as save_log_files.
+
+    Args:
+        filepath: Path to the logs file to occlude entries from
+        occlude_filepath: Path to the occlude logs file to move them to
+        identifiers: Session tags of entries to occlude
+        tags: Tags of entries to occlude
+        dry_run: If True, only find the matching entries
+
+    Returns:
+        The matching entries, in file order
+    """
+    # An entry can only match if its line contains one of the identifiers or
+    # tags as JSON writes them (escaped or raw UTF-8), so only lines found by
+    # a single byte-level search need parsing
+    needles = {form.encode('utf-8')
+               for value in identifiers | tags
+               for form in (json.dumps(value)[1:-1], json.dumps(value, ensure_ascii=False)[1:-1])}
+    if not needles:
+        return []
+    candidate = re.compile(b'|'.join(re.escape(needle) for needle in needles)).search
+
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    # Split the include file's lines into those that stay and those that move
+    kept, moved, matched = [], [], []
+    for raw in data.split(b'\n'):
+        line = raw.strip()
+        if line and not line.startswith(b'#') and candidate(line):
+            try:
+                entry = LogEntry.from_dict(json_loads(line), occlude=True)
+            except json.JSONDecodeError as e:
+                click.echo(f"Warning: Skipping invalid log line: {e}", err=True)
+            else:
+                if entry.session in identifiers or not tags.isdisjoint(entry.tags):
+                    moved.append(line + b'\n')
+                    matched.append(entry)
+                    continue
+        kept.append(raw)
+
+    if dry_run or not matched:
+        return matched
+
+    try:
+        with open(occlude_filepath, 'rb') as f:
+            occlude_data = f.read()
+    except FileNotFoundError:
+        occlude_data = b''
+    if occlude_data and not occlude_data.endswith(b'\n'):
+        occlude_data += b'\n'
+
+    # Temporary files
+    temp_include = filepath + '.temp'
+    temp_occlude = occlude_filepath + '.temp'
+
+    try:
+        write_file_synced(temp_include, b'\n'.join(kept))
+        write_file_synced(temp_occlude, occlude_data + b''.join(moved))
+
+        # If we get here, both writes succeeded, so back up the old
+        # contents and rename temp files
+        for path, temp_path in [(filepath, temp_include), (occlude_filepath, temp_occlude)]:
+            if os.path.exists(path):
+                backup_file(path)
+            os.replace(temp_path, path)
+            _file_digests.pop(path, None)
+        for dirpath in {os.path.dirname(filepath), os.path.dirname(occlude_filepath)}:
+            fsync_directory(dirpath)
+
+    except Exception as e:
+        # Clean up temp files if they exist
+        for temp_file in [temp_include, temp_occlude]:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+        raise click.ClickException(f"Error saving log files: {str(e)}")
+
+    return matched
+
 def run_quick_check(graph: GianttGraph) -> None:
     """Run a quick health check after operations."""
     doctor = GianttDoctor(graph)
@@ -461,10 +763,8 @@ def show_logs(logs, substring):
 @click.argument('substring')
 def show(file: str, occlude_file: str, log_file: str, occlude_log_file: str, chart: bool, log: bool, substring: str):
     """Show details of an item matching the substring."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
-    log_file = log_file or get_default_giantt_path('logs.jsonl')
-    occlude_log_file = occlude_log_file or get_default_giantt_path('logs.jsonl', occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
+    log_file, occlude_log_file = resolve_logs_paths(log_file, occlude_log_file)
 
     graph, log_collection = load_graph_and_logs(file, occlude_file, log_file, occlude_log_file)
     if not chart and not log:
@@ -497,8 +797,7 @@ def log(file: str, occlude_file: str, session: str, tags: str, message: str):
     Example usage:
     $ giantt log rim0 --tags planning,ideas "Initial brainstorming session"
     """
-    file = file or get_default_giantt_path('logs.jsonl')
-    occlude_file = occlude_file or get_default_giantt_path('logs.jsonl', occlude=True)
+    file, occlude_file = resolve_logs_paths(file, occlude_file)
     logs = load_logs(file, occlude_file)
     logs.create_entry(session, message, tags.split(',') if tags else None)
     save_log_files(file, occlude_file, logs)
@@ -511,15 +810,14 @@ def log(file: str, occlude_file: str, session: str, tags: str, message: str):
 @click.argument('new_status', type=click.Choice([s.name for s in Status]))
 def set_status(file: str, occlude_file: str, substring: str, new_status: str):
     """Set the status of an item."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
     graph = load_graph(file, occlude_file)
     try:
         item = graph.find_by_substring(substring)
     except ValueError as e:
         raise click.ClickException(str(e))
     item.status = Status[new_status]
-    save_graph_files(file, occlude_file, graph)
+    save_graph_files(file, occlude_file, graph, check=False)
     click.echo(f"Set status of item '{item.id}' to {new_status}")
 
 @cli.command()
@@ -537,19 +835,22 @@ def set_status(file: str, occlude_file: str, substring: str, new_status: str):
 def add(file: str, occlude_file: str, id: str, title: str, duration: str, priority: str, 
         charts: str, tags: str, status: str, requires: str, any_of: str):
     """Add a new item to the Giantt chart."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
     graph = load_graph(file, occlude_file)
 
     # Validate ID is unique and string search for this ID or title won't conflict with other titles
+    existing = graph.items.get(id)
+    if existing is not None:
+        raise click.ClickException(f"Item ID '{id}' already exists\n"
+                                   f"Existing item: {existing.id} - {existing.title}")
+    id_lower = id.lower()
+    title_lower = title.lower()
     for item in graph.items.values():
-        if item.id == id:
-            raise click.ClickException(f"Item ID '{id}' already exists\n"
-                                       f"Existing item: {item.id} - {item.title}")
-        if id.lower() in item.title.lower():
+        item_title_lower = item.title_lower()
+        if id_lower in item_title_lower:
             raise click.ClickException(f"Item ID '{id}' conflicts with title of another item\n"
                                        f"Conflicting item: {item.id} - {item.title}")
-        if title.lower() in item.title.lower():
+        if title_lower in item_title_lower:
             raise click.ClickException(f"Title '{title}' conflicts with title of another item\n"
                                        f"Conflicting item: {item.id} - {item.title}")
 
@@ -603,8 +904,7 @@ def add(file: str, occlude_file: str, id: str, title: str, duration: str, priori
 def remove(file: str, occlude_file: str, force: bool, item_id: str, keep_relations: bool):
     """Remove an item from the Giantt chart and clean up relations."""
 
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
 
     graph = load_graph(file, occlude_file)
 
@@ -615,6 +915,9 @@ def remove(file: str, occlude_file: str, force: bool, item_id: str, keep_relatio
 
     item = graph.items[item_id]
 
+    # Items referencing this one, by relation type, found in a single pass
+    referencing = graph.reverse_relations().get(item_id, {})
+
     if not force:
         # Display item details
         click.echo(click.style("\nItem to be removed:", fg='yellow', bold=True))
@@ -628,10 +931,8 @@ def remove(file: str, occlude_file: str, force: bool, item_id: str, keep_relatio
 
         # Count affected relations
         relation_counts = {rel: 0 for rel in RelationType._member_names_}
-        for other_item in graph.items.values():
-            for rel_type, targets in other_item.relations.items():
-                if item_id in targets:
-                    relation_counts[rel_type] += 1
+        for rel_type, sources in referencing.items():
+            relation_counts[rel_type] += len(sources)
 
         # Display relation impact
         if any(relation_counts.values()):
@@ -652,10 +953,12 @@ def remove(file: str, occlude_file: str, force: bool, item_id: str, keep_relatio
     del graph.items[item_id]
 
     if not keep_relations:
-        # Remove references in other items
-        for other_item in graph.items.values():
-            for rel_type in other_item.relations:
-                other_item.relations[rel_type] = [t for t in other_item.relations[rel_type] if t != item_id]
+        # Remove references in other items, visiting only those that have any
+        for rel_type, sources in referencing.items():
+            for source_id in sources:
+                other_item = graph.items.get(source_id)
+                if other_item is not None:
+                    other_item.relations[rel_type] = [t for t in other_item.relations[rel_type] if t != item_id]
 
     # Save changes
     save_graph_files(file, occlude_file, graph)
@@ -672,8 +975,7 @@ def remove(file: str, occlude_file: str, force: bool, item_id: str, keep_relatio
 @click.argument('value')
 def modify(file: str, occlude_file: str, add: bool, remove: bool, substring: str, property: str, value: str):
     """Modify any property of a Giantt item."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
     graph = load_graph(file, occlude_file)
     try:
         item = graph.find_by_substring(substring)
@@ -732,7 +1034,9 @@ def modify(file: str, occlude_file: str, add: bool, remove: bool, substring: str
             raise click.ClickException(
                 f"Unknown property. Must be one of: title, duration, priority, status, charts, {', '.join(relation_types)}, or tags")
 
-    save_graph_files(file, occlude_file, graph)
+    # Only relation edits can introduce the dangling references the quick
+    # check looks for
+    save_graph_files(file, occlude_file, graph, check=property.lower() in relation_types)
     click.echo(f"Modified {property} of item '{item.id}'")
 
 
@@ -741,8 +1045,7 @@ def modify(file: str, occlude_file: str, add: bool, remove: bool, substring: str
 @click.option('--occlude-file', '-a', default=None, help='Giantt occluded items file to use')
 def sort(file: str, occlude_file: str):
     """Sort items in topological order and save."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
     graph = load_graph(file, occlude_file)
     try:
         save_graph_files(file, occlude_file, graph)
@@ -762,33 +1065,35 @@ def includes(file: str, recursive: bool):
     """Show the include structure of a Giantt items file."""
     file = file or get_default_giantt_path()
     
-    def process_file(filepath: str, depth: int = 0, visited: Optional[Set[str]] = None) -> None:
-        if visited is None:
-            visited = set()
+    # Walk the include tree depth-first with an explicit stack, so deep
+    # include chains don't hit the recursion limit
+    visited = set()
+    stack = [(file, 0)]
+    while stack:
+        filepath, depth = stack.pop()
             
         if filepath in visited:
             click.echo(f"{'  ' * depth}└─ {filepath} (circular include, skipping)")
-            return
+            continue
             
         visited.add(filepath)
         
         if not os.path.exists(filepath):
             click.echo(f"{'  ' * depth}└─ {filepath} (file not found)")
-            return
+            continue
             
         click.echo(f"{'  ' * depth}└─ {filepath}")
         
         if recursive:
             includes = parse_include_directives(filepath)
-            for include_path in includes:
+            # Push in reverse so includes are shown in file order
+            for include_path in reversed(includes):
                 # Handle relative paths
                 if not os.path.isabs(include_path):
                     base_dir = os.path.dirname(filepath)
                     include_path = os.path.join(base_dir, include_path)
                 
-                process_file(include_path, depth + 1, visited)
-    
-    process_file(file)
+                stack.append((include_path, depth + 1))
 
 @cli.command()
 @click.option('--file', '-f', default=None, help='Giantt items file to use')
@@ -797,13 +1102,15 @@ def includes(file: str, recursive: bool):
 @click.option('--occlude-log-file', '-al', default=None, help='Giantt occlude log file to use')
 def touch(file: str, occlude_file: str, log_file: str, occlude_log_file: str):
     """Touch items and logs files to trigger a reload and save."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
-    log_file = log_file or get_default_giantt_path('logs.jsonl')
-    occlude_log_file = occlude_log_file or get_default_giantt_path('logs.jsonl', occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
+    log_file, occlude_log_file = resolve_logs_paths(log_file, occlude_log_file)
     graph, logs = load_graph_and_logs(file, occlude_file, log_file, occlude_log_file)
-    save_graph_files(file, occlude_file, graph)
-    save_log_files(log_file, occlude_log_file, logs)
+    written = save_graph_files(file, occlude_file, graph)
+    written += save_log_files(log_file, occlude_log_file, logs)
+    # Files that would be rewritten unchanged just get their mtime bumped
+    for path in [file, occlude_file, log_file, occlude_log_file]:
+        if path not in written:
+            os.utime(path, None)
     click.echo("Touched items and logs files")
 
 @cli.command()
@@ -820,8 +1127,7 @@ def touch(file: str, occlude_file: str, log_file: str, occlude_log_file: str):
 def insert(file: str, occlude_file: str, new_id: str, before_id: str, after_id: str,
           charts: str, tags: str, duration: str, priority: str):
     """Insert a new item between two existing items."""
-    file = file or get_default_giantt_path()
-    occlude_file = occlude_file or get_default_giantt_path(occlude=True)
+    file, occlude_file = resolve_items_paths(file, occlude_file)
     graph = load_graph(file, occlude_file)
 
     try:
@@ -866,8 +1172,7 @@ def items(file: str, occlude_file: str, tag: Tuple[str, ...], dry_run: bool, ide
         giantt occluded items --dry-run -t project1
     """
     # Get source and destination files
-    items_file = file or get_default_giantt_path('items.txt')
-    items_occlude = occlude_file or get_default_giantt_path(occlude=True)
+    items_file, items_occlude = resolve_items_paths(file, occlude_file)
 
     # Load current items
     graph = load_graph(items_file, items_occlude)
@@ -888,19 +1193,21 @@ def items(file: str, occlude_file: str, tag: Tuple[str, ...], dry_run: bool, ide
 
     # Find items to occlude
     to_occlude = set()
+    included = graph.included_items()
 
     # Add items by ID
     for id in identifiers:
-        if id in graph.included_items():
+        if id in included:
             to_occlude.add(id)
         else:
             click.echo(f"Warning: Item '{id}' not found in included items", err=True)
 
-    # Add items by tag
-    for t in tag:
-        for item in graph.included_items():
-            if t in graph.items[item].tags:
-                to_occlude.add(item)
+    # Add items by tag, in one pass over the included items
+    if tag:
+        tag_set = set(tag)
+        for item_id, item in included.items():
+            if not tag_set.isdisjoint(item.tags):
+                to_occlude.add(item_id)
 
     if not to_occlude:
         click.echo("No included items found to occlude")
@@ -908,10 +1215,10 @@ def items(file: str, occlude_file: str, tag: Tuple[str, ...], dry_run: bool, ide
 
     # In dry-run mode, just show what would be occluded
     if dry_run:
-        click.echo("The following items would be occluded:")
-        for item_id in sorted(to_occlude):
-            item = graph.items[item_id]
-            click.echo(f"  • {item_id}: {item.title}")
+        # Emit the whole listing in one write
+        lines = ["The following items would be occluded:"]
+        lines.extend(f"  • {item_id}: {graph.items[item_id].title}" for item_id in sorted(to_occlude))
+        click.echo("\n".join(lines))
         return
 
     # Set occlude status for items
@@ -944,28 +1251,10 @@ def logs(file: str, occlude_file: str, tag: Tuple[str, ...], dry_run: bool, iden
         giantt occlude logs --dry-run -t debug
     """
     # Get source and destination files
-    logs_file = file or get_default_giantt_path('logs.jsonl')
-    logs_occlude = occlude_file or get_default_giantt_path('logs.jsonl', occlude=True)
-
-    # Load current logs
-    logs = load_logs(logs_file, logs_occlude)
-
-    # Find logs to occlude
-    to_occlude = []
-
-    for log in logs.include_entries():
-        should_occlude = False
+    logs_file, logs_occlude = resolve_logs_paths(file, occlude_file)
 
-        # Check if log has matching ID
-        if log.session in identifiers:
-            should_occlude = True
-
-        # Check if log has matching tag
-        if any(t in log.tags for t in tag):
-            should_occlude = True
-
-        if should_occlude:
-            to_occlude.append(log)
+    # Move matching logs across in a single pass over the include file
+    to_occlude = occlude_log_lines(logs_file, logs_occlude, set(identifiers), set(tag), dry_run=dry_run)
 
     if not to_occlude:
         click.echo("No include logs found to occlude")
@@ -973,19 +1262,14 @@ def logs(file: str, occlude_file: str, tag: Tuple[str, ...], dry_run: bool, iden
 
     # In dry-run mode, just show what would be occluded
     if dry_run:
-        click.echo("The following logs would be occluded:")
-        for log in to_occlude:
+        # Emit the whole listing in one write
+        lines = ["The following logs would be occluded:"]
+        for log in sorted(to_occlude, key=lambda log: log.timestamp):
             # time needs to be formatted to be human-readable
-            click.echo(f"  • {log.message} ({', '.join(log.tags)}) {log.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"  • {log.message} ({', '.join(log.tags)}) {log.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        click.echo("\n".join(lines))
         return
 
-    # Set occlude status for logs
-    for log in to_occlude:
-        log.set_occlude(True)
-
-    # Save updated logs
-    save_log_files(logs_file, logs_occlude, logs)
-
     click.echo(f"Occluded {len(to_occlude)} log" + ("s" if len(to_occlude) != 1 else ""))
 
 @cli.command()
@@ -999,26 +1283,35 @@ def add_include(file: str, include_path: str):
         raise click.ClickException(f"File not found: {file}")
     
     # Read the current file content
-    with open(file, 'r') as f:
-        content = f.readlines()
+    with open(file, 'rb') as f:
+        data = f.read()
     
-    # Find where to insert the include directive
+    # Find where to insert the include directive, scanning only as far as
+    # the first line that is neither blank nor a comment
     insert_pos = 0
-    for i, line in enumerate(content):
-        if line.strip().startswith('#include '):
-            insert_pos = i + 1
-        elif line.strip() and not line.strip().startswith('#'):
+    start = 0
+    while start < len(data):
+        end = data.find(b'\n', start)
+        end = len(data) if end == -1 else end + 1
+        line = data[start:end].strip()
+        if line.startswith(b'#include '):
+            insert_pos = end
+        elif line and not line.startswith(b'#'):
             break
-    
-    # Create a backup
-    shutil.copyfile(file, increment_backup_name(file))
+        start = end
     
     # Insert the include directive
-    content.insert(insert_pos, f"#include {include_path}\n")
+    directive = f"#include {include_path}\n".encode('utf-8')
+    if insert_pos and not data[:insert_pos].endswith(b'\n'):
+        directive = b'\n' + directive  # Last directive had no line ending
     
-    # Write the updated content
-    with open(file, 'w') as f:
-        f.writelines(content)
+    # Write the updated content to a temp file, then back up the old
+    # file and rename the temp file over it
+    temp_path = file + '.temp'
+    write_file_synced(temp_path, data[:insert_pos] + directive + data[insert_pos:])
+    backup_file(file)
+    os.replace(temp_path, file)
+    fsync_directory(os.path.dirname(file))
     
     click.echo(f"Added include directive for {include_path} to {file}")
 
@@ -1029,7 +1322,7 @@ def clean(yes: bool, keep: int):
     """Clean up backup files, keeping only the most recent few backups.
 
     By default, keeps the 3 most recent backups and renames them to .1.backup (oldest),
-    .2.backup, and .3.backup (newest).
+    .2.backup, and .3.backup (newest). Compressed backups keep their .backup.gz suffix.
     """
 
     # Get paths using the existing function
@@ -1044,34 +1337,26 @@ def clean(yes: bool, keep: int):
     include_dir = Path(include_items_path).parent
     occlude_dir = Path(occlude_items_path).parent
 
-    items_pattern = re.compile(r'items\.txt\.(\d+)\.backup$')
-    logs_pattern = re.compile(r'logs\.jsonl\.(\d+)\.backup$')
-
-    # Find all backup files
-    backup_files = []
+    backup_pattern = re.compile(r'^(items\.txt|logs\.jsonl)\.(\d+)(\.backup(?:\.gz)?)$')
 
+    # Find all backup files in one directory scan each, grouped by base filename
+    backup_count = 0
+    grouped_backups = {}
     for directory in [include_dir, occlude_dir]:
-        for filename in directory.glob('*.backup'):
-            if items_pattern.search(filename.name) or logs_pattern.search(filename.name):
-                backup_files.append(filename)
-
-    if not backup_files:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = backup_pattern.match(entry.name)
+                if not match:
+                    continue
+                base_name, backup_num, suffix = match.groups()  # e.g., "items.txt", "3", ".backup.gz"
+                grouped_backups.setdefault((directory, base_name), []).append(
+                    (int(backup_num), suffix, directory / entry.name))
+                backup_count += 1
+
+    if not backup_count:
         click.echo("No backup files found.")
         return
 
-    # Group by base filename
-    grouped_backups = {}
-    for filepath in backup_files:
-        base_name = filepath.name.split('.', 1)[0] + '.' + filepath.name.split('.', 2)[1]  # e.g., "items.txt" or "logs.jsonl"
-        directory = filepath.parent
-        key = (directory, base_name)
-
-        if key not in grouped_backups:
-            grouped_backups[key] = []
-
-        backup_num = int(filepath.name.split('.')[-2])  # Extract backup number
-        grouped_backups[key].append((backup_num, filepath))
-
     # Sort each group by backup number (descending) and determine files to delete
     to_delete = []
     to_rename = {}
@@ -1082,20 +1367,20 @@ def clean(yes: bool, keep: int):
 
         # Keep only the most recent 'keep' backups
         if len(backups) > keep:
-            to_delete.extend([filepath for _, filepath in backups[keep:]])
+            to_delete.extend([filepath for _, _, filepath in backups[keep:]])
 
         # Rename the kept backups to .1.backup, .2.backup, etc.
         # Oldest backup gets .1.backup, newest gets .<keep>.backup
         kept_backups = backups[:keep]
         kept_backups.reverse()  # Reverse so oldest is first
 
-        for i, (_, filepath) in enumerate(kept_backups):
-            new_filename = directory / f"{base_name}.{i+1}.backup"
+        for i, (_, suffix, filepath) in enumerate(kept_backups):
+            new_filename = directory / f"{base_name}.{i+1}{suffix}"
             to_rename[filepath] = new_filename
 
     # Show summary and confirm
-    click.echo(f"Found {len(backup_files)} backup files across all directories.")
-    click.echo(f"Will keep {min(keep, len(backup_files))} most recent backups of each file.")
+    click.echo(f"Found {backup_count} backup files across all directories.")
+    click.echo(f"Will keep {min(keep, backup_count)} most recent backups of each file.")
     if not to_delete:
         click.echo("No files to delete.")
         return
@@ -1104,29 +1389,30 @@ def clean(yes: bool, keep: int):
     if to_delete and not yes:
         click.confirm("Do you want to proceed?", abort=True)
 
+    # Imported here since only clean uses it, and it pulls in logging and
+    # threading, which every other command would pay for at startup
+    from concurrent.futures import ThreadPoolExecutor
+
     # Perform operations
-    temp_dir = Path(tempfile.mkdtemp())
+    # Stage deletions next to the backup directories rather than in the system
+    # temp dir, so every move below is a plain same-filesystem rename
+    temp_dir = Path(tempfile.mkdtemp(dir=include_dir.parent))
+    # Include and occlude backups can share names, so prefix staged names
+    staged = lambda filepath: temp_dir / f"{filepath.parent.name}_{filepath.name}"
+    # Kept files are renamed in two phases, via a temporary name in their own
+    # directory, so no rename lands on a file that has yet to move
+    renames = [(old_path, new_path) for old_path, new_path in to_rename.items() if old_path != new_path]
+    renaming = lambda filepath: filepath.with_name(filepath.name + '.renaming')
     try:
-        # First move files to be deleted to a temp directory
-        for filepath in to_delete:
-            shutil.move(str(filepath), str(temp_dir / filepath.name))
-
-        # Then rename the files to be kept
-        # We need to handle rename conflicts carefully
-        rename_plan = []
-        for old_path, new_path in to_rename.items():
-            if old_path.exists():  # May have been deleted in cleanup
-                # If target exists, need temp name
-                if new_path.exists() and old_path != new_path:
-                    temp_path = temp_dir / f"temp_{old_path.name}"
-                    rename_plan.append((old_path, temp_path))
-                    rename_plan.append((temp_path, new_path))
-                else:
-                    rename_plan.append((old_path, new_path))
-
-        # Execute renames in order
-        for old_path, new_path in rename_plan:
-            shutil.move(str(old_path), str(new_path))
+        # The moves within each phase are independent, so overlap their
+        # syscall latency; each phase completes before the next starts
+        with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+            # First move files to be deleted to a temp directory
+            list(executor.map(lambda filepath: os.replace(filepath, staged(filepath)), to_delete))
+
+            # Then rename the files to be kept
+            list(executor.map(lambda pair: os.replace(pair[0], renaming(pair[0])), renames))
+            list(executor.map(lambda pair: os.replace(renaming(pair[0]), pair[1]), renames))
 
         # Finally delete the temp directory with all files to be deleted
         shutil.rmtree(temp_dir)
@@ -1139,9 +1425,13 @@ def clean(yes: bool, keep: int):
         try:
             # Try to restore any moved files
             for filepath in to_delete:
-                temp_path = temp_dir / filepath.name
+                temp_path = staged(filepath)
                 if temp_path.exists():
-                    shutil.move(str(temp_path), str(filepath))
+                    os.replace(temp_path, filepath)
+            for old_path, _ in renames:
+                temp_path = renaming(old_path)
+                if temp_path.exists():
+                    os.replace(temp_path, old_path)
             shutil.rmtree(temp_dir)
             click.echo("Recovery completed.", err=True)
         except Exception as recovery_error:
@@ -1155,8 +1445,7 @@ def clean(yes: bool, keep: int):
 def doctor(ctx, file: str, occlude_file: str):
     """Check the health of the Giantt graph and fix issues."""
     ctx.ensure_object(dict)
-    ctx.obj['file'] = file or get_default_giantt_path()
-    ctx.obj['occlude_file'] = occlude_file or get_default_giantt_path(occlude=True)
+    ctx.obj['file'], ctx.obj['occlude_file'] = resolve_items_paths(file, occlude_file)
     ctx.obj['graph'] = load_graph(ctx.obj['file'], ctx.obj['occlude_file'])
     ctx.obj['doctor'] = GianttDoctor(ctx.obj['graph'])
 
@@ -1178,14 +1467,15 @@ def doctor_check(ctx):
             issues_by_type[issue.type] = []
         issues_by_type[issue.type].append(issue)
 
-    # Print issues
-    click.echo(click.style(f"\nFound {len(issues)} issue" + ("s" if len(issues) != 1 else "") + ":", fg='yellow'))
+    # Print issues, collected into one write
+    lines = [click.style(f"\nFound {len(issues)} issue" + ("s" if len(issues) != 1 else "") + ":", fg='yellow')]
     for issue_type, type_issues in issues_by_type.items():
-        click.echo(f"\n{issue_type.value} ({len(type_issues)} issues):")
+        lines.append(f"\n{issue_type.value} ({len(type_issues)} issues):")
         for issue in type_issues:
-            click.echo(f"  • {issue.item_id}: {issue.message}")
+            lines.append(f"  • {issue.item_id}: {issue.message}")
             if issue.suggested_fix:
-                click.echo(f"    Suggested fix: {issue.suggested_fix}")
+                lines.append(f"    Suggested fix: {issue.suggested_fix}")
+    click.echo("\n".join(lines))
 
 @doctor.command('fix')
 @click.option('--type', '-t', 'issue_type', help='Type of issue to fix (e.g., dangling_reference)')
@@ -1262,11 +1552,8 @@ def doctor_fix(ctx, issue_type: str, item: str, all: bool, dry_run: bool):
         click.echo("Aborted. No changes made.")
         return
         
-    # Fix issues
-    fixed_issues = doctor.fix_issues(
-        issue_type=issue_type_enum if issue_type else None,
-        item_id=item
-    )
+    # Fix the issues already selected above
+    fixed_issues = doctor.fix_issues(issues=issues_to_fix)
     
     if fixed_issues:
         # Save changes
@@ -1,4 +1,7 @@
 from typing import List, Optional, Tuple, Dict, Set
+from collections import defaultdict, deque
+import bisect
+import operator
 from dataclasses import dataclass, field
 import re
 from enum import Enum
@@ -6,6 +9,34 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+# A run of digits long enough to be an integer outside 64 bits, which orjson
+# would silently turn into a float
+LONG_DIGITS_RE = re.compile(r'[0-9]{19}')
+LONG_DIGITS_BYTES_RE = re.compile(rb'[0-9]{19}')
+
+# orjson parses log lines several times faster when it is installed. Lines
+# are still written with json.dumps, whose output orjson doesn't match
+try:
+    import orjson
+
+    def json_loads(data):
+        """Parse JSON text or bytes exactly as json.loads would.
+
+        orjson rejects NaN and Infinity, which json.dumps writes, and turns
+        integers outside 64 bits into floats, so lines it fails on or that
+        could hold such integers are parsed by json.loads instead. Errors
+        are json.loads's own json.JSONDecodeError.
+        """
+        long_digits = LONG_DIGITS_BYTES_RE if isinstance(data, bytes) else LONG_DIGITS_RE
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except json.JSONDecodeError:
+                pass
+        return json.loads(data)
+except ImportError:
+    json_loads = json.loads
+
 class Status(Enum):
     NOT_STARTED = "○"
     IN_PROGRESS = "◑"
@@ -81,58 +112,75 @@ class EscalationRate(Enum):
     CRITICAL = "!!!"
 
 
+# Seconds per canonical duration unit
+UNIT_SECONDS = {
+    's': 1,
+    'min': 60,
+    'h': 3600,
+    'hr': 3600,
+    'd': 86400,
+    'w': 604800,
+    'mo': 2592000,  # 30 days
+    'y': 31536000,  # 365 days
+}
+
+# Units from largest to smallest, for picking the largest unit that fits
+UNIT_SECONDS_DESC = tuple(sorted(UNIT_SECONDS.items(), key=lambda x: x[1], reverse=True))
+
+# Spelled-out and alternative unit names, mapped to their canonical unit
+UNIT_NORMALIZE = {
+    'hr': 'h',
+    'minute': 'min',
+    'minutes': 'min',
+    'hour': 'h',
+    'hours': 'h',
+    'day': 'd',
+    'days': 'd',
+    'week': 'w',
+    'weeks': 'w',
+    'month': 'mo',
+    'months': 'mo',
+    'year': 'y',
+    'years': 'y'
+}
+
+
 @dataclass(frozen=True)
 class DurationPart:
     """Represents a single part of a duration with an amount and unit."""
     amount: float
     unit: str
 
-    _UNIT_SECONDS = {
-        's': 1,
-        'min': 60,
-        'h': 3600,
-        'hr': 3600,
-        'd': 86400,
-        'w': 604800,
-        'mo': 2592000,  # 30 days
-        'y': 31536000,  # 365 days
-    }
-
-    _UNIT_NORMALIZE = {
-        'hr': 'h',
-        'minute': 'min',
-        'minutes': 'min',
-        'hour': 'h',
-        'hours': 'h',
-        'day': 'd',
-        'days': 'd',
-        'week': 'w',
-        'weeks': 'w',
-        'month': 'mo',
-        'months': 'mo',
-        'year': 'y',
-        'years': 'y'
-    }
+    # Slots rather than a per-part __dict__, since every item holds at least
+    # one part. _total_seconds is computed once, in __post_init__
+    __slots__ = ('amount', 'unit', '_total_seconds')
 
     @classmethod
     def create(cls, amount: float, unit: str) -> 'DurationPart':
         """Factory method to create a normalized DurationPart."""
-        normalized_unit = cls._UNIT_NORMALIZE.get(unit, unit)
+        normalized_unit = UNIT_NORMALIZE.get(unit, unit)
 
-        if normalized_unit not in cls._UNIT_SECONDS:
+        if normalized_unit not in UNIT_SECONDS:
             raise ValueError(f"Invalid duration unit: {unit}")
 
         return cls(amount, normalized_unit)
 
     def __post_init__(self):
-        """Validate the unit."""
-        if self.unit not in self._UNIT_SECONDS:
+        """Validate the unit and compute the total."""
+        if self.unit not in UNIT_SECONDS:
             raise ValueError(f"Invalid duration unit: {self.unit}")
+        # Frozen dataclasses refuse plain attribute assignment
+        object.__setattr__(self, '_total_seconds', self.amount * UNIT_SECONDS[self.unit])
+
+    def __reduce__(self):
+        # Frozen slotted instances can't have their state restored by the
+        # default pickle protocol, so rebuild them through __init__
+        return (DurationPart, (self.amount, self.unit))
 
     @property
     def total_seconds(self) -> float:
         """Get total seconds."""
-        return self.amount * self._UNIT_SECONDS[self.unit]
+        return self._total_seconds
 
     def __str__(self):
         # For whole numbers, display as integers
@@ -143,6 +191,9 @@ class DurationPart:
         return hash((self.amount, self.unit))
 
 
+# One amount-and-unit part of a compound duration, e.g. '3.5s' in '6mo8d3.5s'
+DURATION_PART_RE = re.compile(r'(\d+\.?\d*)([a-zA-Z]+)')
+
 @dataclass(frozen=True)
 class Duration:
     """Handles compound durations like '6mo8d3.5s'."""
@@ -155,14 +206,13 @@ class Duration:
         if not duration_str:
             raise ValueError("Empty duration string")
 
-        pattern = r'(\d+\.?\d*)([a-zA-Z]+)'
-        matches = re.finditer(pattern, duration_str)
+        # DurationPart.create inlined, since this runs for every item loaded
         parts = []
-
-        for match in matches:
-            amount = float(match.group(1))
-            unit = match.group(2)
-            parts.append(DurationPart.create(amount, unit))
+        for amount, unit in DURATION_PART_RE.findall(duration_str):
+            normalized_unit = UNIT_NORMALIZE.get(unit, unit)
+            if normalized_unit not in UNIT_SECONDS:
+                raise ValueError(f"Invalid duration unit: {unit}")
+            parts.append(DurationPart(float(amount), normalized_unit))
 
         if not parts:
             raise ValueError(f"No valid duration parts found in: {duration_str}")
@@ -170,8 +220,17 @@ class Duration:
         return cls(parts)
 
     def total_seconds(self):
-        """Get total duration in seconds."""
-        return sum(part.total_seconds for part in self.parts)
+        """Get total duration in seconds.
+
+        The total is computed on first use and kept on the instance, since
+        durations are frozen and every comparison asks for it.
+        """
+        total = self.__dict__.get('_total_seconds')
+        if total is None:
+            total = sum(part.total_seconds for part in self.parts)
+            # Frozen dataclasses refuse plain attribute assignment
+            object.__setattr__(self, '_total_seconds', total)
+        return total
 
     def __str__(self):
         """String representation of duration."""
@@ -184,13 +243,10 @@ class Duration:
         total_seconds = self.total_seconds() + other.total_seconds()
 
         # Convert back to largest sensible unit
-        for unit, seconds in sorted(self._UNIT_SECONDS.items(), 
-                                  key=lambda x: x[1], reverse=True):
+        for unit, seconds in UNIT_SECONDS_DESC:
             if total_seconds >= seconds:
-                amount = total_seconds / seconds
-                if amount.is_integer():
-                    amount = int(amount)
-                return Duration([DurationPart(amount, unit)])
+                # Kept a float; DurationPart prints whole amounts without a decimal
+                return Duration([DurationPart(total_seconds / seconds, unit)])
 
         return Duration([DurationPart(total_seconds, 's')])
 
@@ -257,6 +313,12 @@ class TimeWindow:
         return base
 
 
+# Time constraint forms: window(<duration>[:<grace>],<consequence>),
+# due(<date>[:<grace>],<consequence>) and every(<interval>[:<grace>],<consequence>)
+WINDOW_RE = re.compile(r'window\((\d+[smhdwy])(:\d+[smhdwy])?,([^)]+)\)')
+DEADLINE_RE = re.compile(r'due\((\d{4}-\d{2}-\d{2})(:\d+[smhdwy])?,([^)]+)\)')
+RECURRING_RE = re.compile(r'every\((\d+[smhdwy])(:\d+[smhdwy])?,([^)]+)\)')
+
 @dataclass
 class TimeConstraint:
     type: TimeConstraintType
@@ -273,8 +335,9 @@ class TimeConstraint:
         if not constraint_str:
             return None
 
+        # Each form is tried only when the string starts with its keyword
         # Parse window constraints
-        window_match = re.match(r'window\((\d+[smhdwy])(:\d+[smhdwy])?,([^)]+)\)', constraint_str)
+        window_match = constraint_str.startswith('window(') and WINDOW_RE.match(constraint_str)
         if window_match:
             window = Duration.parse(window_match.group(1))
             grace = Duration.parse(window_match.group(2)[1:]) if window_match.group(2) else None
@@ -289,7 +352,7 @@ class TimeConstraint:
             )
 
         # Parse deadline constraints
-        deadline_match = re.match(r'due\((\d{4}-\d{2}-\d{2})(:\d+[smhdwy])?,([^)]+)\)', constraint_str)
+        deadline_match = constraint_str.startswith('due(') and DEADLINE_RE.match(constraint_str)
         if deadline_match:
             due_date = deadline_match.group(1)
             grace = Duration.parse(deadline_match.group(2)[1:]) if deadline_match.group(2) else None
@@ -305,7 +368,7 @@ class TimeConstraint:
             )
 
         # Parse recurring constraints
-        recurring_match = re.match(r'every\((\d+[smhdwy])(:\d+[smhdwy])?,([^)]+)\)', constraint_str)
+        recurring_match = constraint_str.startswith('every(') and RECURRING_RE.match(constraint_str)
         if recurring_match:
             interval = Duration.parse(recurring_match.group(1))
             grace = Duration.parse(recurring_match.group(2)[1:]) if recurring_match.group(2) else None
@@ -348,11 +411,12 @@ class TimeConstraint:
 
     @staticmethod
     def _parse_consequence(consequence_str: str) -> dict:
-        parts = consequence_str.split(',')
-        base_consequence = parts[0].strip()
+        # Only the field after the first comma can hold an escalation rate
+        base_consequence, _, rest = consequence_str.partition(',')
+        base_consequence = base_consequence.strip()
 
-        if len(parts) > 1 and parts[1].startswith('escalate:'):
-            rate_str = parts[1][9:]  # Remove 'escalate:'
+        if rest.startswith('escalate:'):
+            rate_str = rest[9:].partition(',')[0]  # Remove 'escalate:'
             return {
                 'type': ConsequenceType.ESCALATING,
                 'rate': EscalationRate(rate_str) if rate_str else EscalationRate.NEUTRAL
@@ -364,11 +428,12 @@ class TimeConstraint:
         }
 
 
+# Updated pattern to be more flexible with whitespace
+PRE_TITLE_RE = re.compile(r'^([○◑⊘●])\s+([^\s]+)\s+([^\s"]+)')
+
 def parse_pre_title_section(pre_title: str) -> Tuple[str, str, str]:
     """Parse the pre-title section into status, id+priority, and duration."""
-    # Updated pattern to be more flexible with whitespace
-    pattern = r'^([○◑⊘●])\s+([^\s]+)\s+([^\s"]+)'
-    match = re.match(pattern, pre_title)
+    match = PRE_TITLE_RE.match(pre_title)
 
     if not match:
         raise ValueError(f"Invalid pre-title format: {pre_title}")
@@ -379,60 +444,77 @@ def parse_pre_title_section(pre_title: str) -> Tuple[str, str, str]:
 
     return status, id_priority, duration
 
+# The charts set at the start of the post-title section, and what follows it
+CHARTS_RE = re.compile(r'^\s*(\{[^}]+\})\s*(.*)$')
+
+# A relation symbol and its bracketed, comma-separated target IDs
+RELATION_RE = re.compile('([' + ''.join(r.value for r in RelationType) + r'])\[([^]]+)\]')
+RELATION_NAMES = {r.value: r.name for r in RelationType}
+RELATION_SYMBOLS = {r.name: r.value for r in RelationType}
+
 @dataclass
 class GianttItem:
+    # No class-level defaults, since they would clash with __slots__; the
+    # __init__ below is the only constructor
     id: str
-    title: str = ""
-    description: str = ""
-    status: Status = Status.NOT_STARTED
-    priority: Priority = Priority.NEUTRAL
-    duration: Duration = Duration()
-    charts: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
-    relations: dict = field(default_factory=dict)
-    time_constraint: Optional[TimeConstraint] = None
-    user_comment: Optional[str] = None
-    auto_comment: Optional[str] = None
-    occlude: bool = False
-
-    # type-check everything
+    title: str
+    description: str
+    status: Status
+    priority: Priority
+    duration: Duration
+    charts: List[str]
+    tags: List[str]
+    relations: dict
+    time_constraint: Optional[TimeConstraint]
+    user_comment: Optional[str]
+    auto_comment: Optional[str]
+    occlude: bool
+
+    # Slots rather than a per-item __dict__, since large graphs hold many items.
+    # _title_lower caches title_lower() and is not a field
+    __slots__ = ('id', 'title', 'description', 'status', 'priority', 'duration', 'charts', 'tags',
+                 'relations', 'time_constraint', 'user_comment', 'auto_comment', 'occlude',
+                 '_title_lower')
+
+    # type-check everything, unless running under python -O
     def __init__(self, id: str, title: str, description: str, status: Status, priority: Priority, duration: Duration, charts: List[str], tags: List[str], relations: dict, time_constraint: Optional[TimeConstraint], user_comment: Optional[str], auto_comment: Optional[str], occlude: bool = False):
-        if not isinstance(id, str):
-            raise TypeError(f"id must be a string, not {type(id)}")
-        if not isinstance(title, str):
-            raise TypeError(f"title must be a string, not {type(title)}")
-        if not isinstance(description, str):
-            raise TypeError(f"description must be a string, not {type(description)}")
-        if not isinstance(status, Status):
-            raise TypeError(f"status must be a Status, not {type(status)}")
-        if not isinstance(priority, Priority):
-            raise TypeError(f"priority must be a Priority, not {type(priority)}")
-        if not isinstance(duration, Duration):
-            raise TypeError(f"duration must be a Duration, not {type(duration)}")
-        if not isinstance(charts, list):
-            raise TypeError(f"charts must be a list, not {type(charts)}")
-        if not all(isinstance(i, str) for i in charts):
-            raise TypeError(f"all elements of charts must be a string")
-        if not isinstance(tags, list):
-            raise TypeError(f"tags must be a list, not {type(tags)}")
-        if not all(isinstance(i, str) for i in tags):
-            raise TypeError(f"all elements of tags must be a string")
-        if not isinstance(relations, dict):
-            raise TypeError(f"relations must be a dict, not {type(relations)}")
-        if not all(isinstance(k, str) for k in relations.keys()):
-            raise TypeError(f"all keys of relations must be a string")
-        if not all(isinstance(v, list) for v in relations.values()):
-            raise TypeError(f"all values of relations must be a list")
-        if not all(all(isinstance(i, str) for i in v) for v in relations.values()):
-            raise TypeError(f"all elements of all values of relations must be a string")
-        if not isinstance(time_constraint, (TimeConstraint, type(None))):
-            raise TypeError(f"time_constraint must be a TimeConstraint or None, not {type(time_constraint)}")
-        if not isinstance(user_comment, (str, type(None))):
-            raise TypeError(f"user_comment must be a string or None, not {type(user_comment)}")
-        if not isinstance(auto_comment, (str, type(None))):
-            raise TypeError(f"auto_comment must be a string or None, not {type(auto_comment)}")
-        if not isinstance(occlude, bool):
-            raise TypeError(f"occlude must be a bool, not {type(occlude)}")
+        if __debug__:
+            if not isinstance(id, str):
+                raise TypeError(f"id must be a string, not {type(id)}")
+            if not isinstance(title, str):
+                raise TypeError(f"title must be a string, not {type(title)}")
+            if not isinstance(description, str):
+                raise TypeError(f"description must be a string, not {type(description)}")
+            if not isinstance(status, Status):
+                raise TypeError(f"status must be a Status, not {type(status)}")
+            if not isinstance(priority, Priority):
+                raise TypeError(f"priority must be a Priority, not {type(priority)}")
+            if not isinstance(duration, Duration):
+                raise TypeError(f"duration must be a Duration, not {type(duration)}")
+            if not isinstance(charts, list):
+                raise TypeError(f"charts must be a list, not {type(charts)}")
+            if not all(isinstance(i, str) for i in charts):
+                raise TypeError(f"all elements of charts must be a string")
+            if not isinstance(tags, list):
+                raise TypeError(f"tags must be a list, not {type(tags)}")
+            if not all(isinstance(i, str) for i in tags):
+                raise TypeError(f"all elements of tags must be a string")
+            if not isinstance(relations, dict):
+                raise TypeError(f"relations must be a dict, not {type(relations)}")
+            if not all(isinstance(k, str) for k in relations.keys()):
+                raise TypeError(f"all keys of relations must be a string")
+            if not all(isinstance(v, list) for v in relations.values()):
+                raise TypeError(f"all values of relations must be a list")
+            if not all(all(isinstance(i, str) for i in v) for v in relations.values()):
+                raise TypeError(f"all elements of all values of relations must be a string")
+            if not isinstance(time_constraint, (TimeConstraint, type(None))):
+                raise TypeError(f"time_constraint must be a TimeConstraint or None, not {type(time_constraint)}")
+            if not isinstance(user_comment, (str, type(None))):
+                raise TypeError(f"user_comment must be a string or None, not {type(user_comment)}")
+            if not isinstance(auto_comment, (str, type(None))):
+                raise TypeError(f"auto_comment must be a string or None, not {type(auto_comment)}")
+            if not isinstance(occlude, bool):
+                raise TypeError(f"occlude must be a bool, not {type(occlude)}")
 
         self.id = id
         self.title = title
@@ -467,7 +549,12 @@ class GianttItem:
         if title_end == -1:
             raise ValueError("No ending quote found for title")
 
-        title = json.loads(line[title_start:title_end + 1])
+        # Most titles have no escapes, and need no JSON decoding at all.
+        # Anything json.loads might treat differently, escapes or control
+        # characters, still goes through it
+        title = line[title_start + 1:title_end]
+        if '\\' in title or not title.isprintable():
+            title = json.loads(line[title_start:title_end + 1])
         post_title = line[title_end + 1:].strip()
 
         # Extract ID and priority
@@ -486,8 +573,7 @@ class GianttItem:
         duration = Duration.parse(duration_str)
 
         # Parse post-title section
-        charts_pattern = re.compile(r'^\s*(\{[^}]+\})\s*(.*)$')
-        charts_match = charts_pattern.match(post_title)
+        charts_match = CHARTS_RE.match(post_title)
         if not charts_match:
             raise ValueError("Invalid charts format")
 
@@ -510,15 +596,15 @@ class GianttItem:
         # Parse tags
         tags = [t.strip() for t in tags_str.split(",") if t.strip()]
 
-        # Parse relations
-        relations = {}
-        rel_symbols = {r.value: r.name for r in RelationType}
-
-        for symbol, rel_type in rel_symbols.items():
-            pattern = f"{symbol}\\[([^]]+)\\]"
-            matches = re.findall(pattern, relations_str)
-            if matches:
-                relations[rel_type] = [t.strip() for t in matches[0].split(",")]
+        # Parse relations in one scan. Only the first list given for each
+        # relation type counts, and types are kept in RelationType order so
+        # items are written back out the same way
+        found = {}
+        for symbol, targets in RELATION_RE.findall(relations_str):
+            rel_type = RELATION_NAMES[symbol]
+            if rel_type not in found:
+                found[rel_type] = [t.strip() for t in targets.split(",")]
+        relations = {rel.name: found[rel.name] for rel in RelationType if rel.name in found}
 
         return cls(
             id=id_str,
@@ -544,8 +630,7 @@ class GianttItem:
         rel_parts = []
         for rel_type, targets in self.relations.items():
             if targets:
-                symbol = RelationType[rel_type].value
-                rel_parts.append(f"{symbol}[{','.join(targets)}]")
+                rel_parts.append(f"{RELATION_SYMBOLS[rel_type]}[{','.join(targets)}]")
         relations_str = ' >>> ' + ' '.join(rel_parts) if rel_parts else ""
 
         # JSON encode the title to handle special characters properly
@@ -558,6 +643,22 @@ class GianttItem:
 
         return f"{self.status.value} {self.id}{self.priority.value} {self.duration} {title_str} {charts_str}{tags_str}{relations_str}{user_comment_str}{auto_comment_str}"
 
+    def title_lower(self) -> str:
+        """Get the lowercased title, for case-insensitive searches.
+
+        It is cached along with the title it came from, so it is recomputed
+        only after the title is reassigned.
+        """
+        try:
+            title, lowered = self._title_lower
+            if title is self.title:
+                return lowered
+        except AttributeError:
+            pass
+        lowered = self.title.lower()
+        self._title_lower = (self.title, lowered)
+        return lowered
+
     def set_occlude(self, occlude: bool):
         self.occlude = occlude
 
@@ -571,7 +672,8 @@ class GianttItem:
             self.duration,
             self.charts.copy(),
             self.tags.copy(),
-            self.relations.copy(),
+            # Copy the target lists too, since some edits mutate them in place
+            {rel_type: targets.copy() for rel_type, targets in self.relations.items()},
             self.time_constraint,
             self.user_comment,
             self.auto_comment,
@@ -592,8 +694,25 @@ class GianttGraph:
     def add_item(self, item: GianttItem):
         self.items[item.id] = item
 
+    def reverse_relations(self) -> Dict[str, Dict[str, List[str]]]:
+        """Map each target ID to the IDs of items referencing it, by relation type.
+
+        Relation lists are edited in place in many places, so this is built
+        on demand in one pass rather than kept up to date in add_item.
+        """
+        reverse: Dict[str, Dict[str, List[str]]] = {}
+        for item in self.items.values():
+            for rel_type, targets in item.relations.items():
+                for target in targets:
+                    sources = reverse.setdefault(target, {}).setdefault(rel_type, [])
+                    # An item listing the same target twice is one reference
+                    if not sources or sources[-1] != item.id:
+                        sources.append(item.id)
+        return reverse
+
     def find_by_substring(self, substring: str) -> GianttItem:
-        matches = [item for item in self.items.values() if substring.lower() in item.title.lower() or substring == item.id]
+        substring_lower = substring.lower()
+        matches = [item for item in self.items.values() if substring_lower in item.title_lower() or substring == item.id]
         if not matches:
             raise ValueError(f"No items with ID '{substring}' or title containing '{substring}' found")
         if len(matches) > 1:
@@ -614,30 +733,33 @@ class GianttGraph:
         Raises:
             CycleDetectedException: If a dependency cycle is detected, with details about the cycle
         """
+        items = self.items
+
         # Build adjacency list for strict relations
-        adj_list = {item.id: set() for item in self.items.values()}
-        for item in self.items.values():
-            for rel_type in ['REQUIRES']:
-                if rel_type in item.relations:
-                    for target in item.relations[rel_type]:
-                        if target not in adj_list:
-                            continue # Skip non-existent items
-                        adj_list[item.id].add(target)
+        adj_list = {item_id: set() for item_id in items}
+        for item_id, item in items.items():
+            targets = item.relations.get('REQUIRES')
+            if targets:
+                neighbors = adj_list[item_id]
+                for target in targets:
+                    if target in adj_list: # Skip non-existent items
+                        neighbors.add(target)
 
         # Calculate in-degrees
-        in_degree = {node: 0 for node in adj_list}
-        for node in adj_list:
-            for neighbor in adj_list[node]:
-                in_degree[neighbor] = in_degree.get(neighbor, 0) + 1
+        in_degree = dict.fromkeys(adj_list, 0)
+        for neighbors in adj_list.values():
+            for neighbor in neighbors:
+                in_degree[neighbor] += 1
 
         # Find nodes with no dependencies
-        queue = [node for node, degree in in_degree.items() if degree == 0]
+        # A deque, since popping from the front of a list is O(n)
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
         sorted_items = []
         visited = set()
 
         while queue:
-            node = queue.pop(0)
-            sorted_items.append(self.items[node])
+            node = queue.popleft()
+            sorted_items.append(items[node])
             visited.add(node)
 
             for neighbor in adj_list[node]:
@@ -646,35 +768,39 @@ class GianttGraph:
                     queue.append(neighbor)
 
         # If we haven't visited all nodes, there must be a cycle
-        if len(sorted_items) != len(self.items):
+        if len(sorted_items) != len(items):
             # Find the cycle for better error reporting
             def find_cycle():
-                unvisited = set(self.items.keys()) - visited
-                stack = []
-                path = []
-
-                def dfs(current):
-                    if current in stack:
-                        cycle_start = stack.index(current)
-                        return stack[cycle_start:]
-                    if current in visited:
-                        return None
-
-                    stack.append(current)
-                    for neighbor in adj_list[current]:
-                        cycle = dfs(neighbor)
-                        if cycle:
-                            return cycle
-                    stack.pop()
-                    return None
+                unvisited = items.keys() - visited
 
-                # Start DFS from any unvisited node
+                # Iterative DFS, so deep dependency chains can't exhaust the
+                # recursion limit. Each frame holds a node and an iterator
+                # over the neighbors it has yet to explore
                 start_node = next(iter(unvisited))
-                cycle = dfs(start_node)
-                if cycle:
-                    # Add one more occurrence of first node to show complete cycle
-                    cycle.append(cycle[0])
-                return cycle or []
+                stack = [start_node]
+                on_stack = {start_node}
+                finished = set()
+                frames = [(start_node, iter(adj_list[start_node]))]
+                while frames:
+                    current, neighbors = frames[-1]
+                    for neighbor in neighbors:
+                        if neighbor in on_stack:
+                            cycle = stack[stack.index(neighbor):]
+                            # Add one more occurrence of first node to show complete cycle
+                            cycle.append(cycle[0])
+                            return cycle
+                        if neighbor not in visited and neighbor not in finished:
+                            stack.append(neighbor)
+                            on_stack.add(neighbor)
+                            frames.append((neighbor, iter(adj_list[neighbor])))
+                            break
+                    else:
+                        # No cycle runs through this node's remaining neighbors
+                        frames.pop()
+                        stack.pop()
+                        on_stack.discard(current)
+                        finished.add(current)
+                return []
 
             cycle = find_cycle()
             raise CycleDetectedException(cycle)
@@ -691,11 +817,15 @@ class GianttGraph:
         sorted_items = self._safe_topological_sort()
 
         # Now within each "level" (items with same dependencies depth),
-        # sort by deterministic criteria
+        # sort by deterministic criteria. Depths are shared between items
+        # through one cache, so each is computed once per sort. sorted()
+        # computes keys in list order, and sorted_items has dependencies
+        # before dependents, so each lookup recurses at most one level
+        depth_cache: Dict[str, int] = {}
         def get_item_sort_key(item):
             return (
                 # Primary sort by topological depth
-                self._get_dependency_depth(item),
+                self._get_dependency_depth(item, depth_cache),
                 # Secondary sort by ID (deterministic tie-breaker)
                 item.id,
                 # Could add more deterministic criteria here
@@ -703,18 +833,48 @@ class GianttGraph:
 
         return sorted(sorted_items, key=get_item_sort_key)
 
-    def _get_dependency_depth(self, item):
-        """Get the maximum dependency depth of an item."""
+    def _get_dependency_depth(self, item, cache: Optional[Dict[str, int]] = None):
+        """Get the maximum dependency depth of an item.
+
+        Depths already in cache are reused, and new ones are added to it.
+        """
+        if cache is None:
+            cache = {}
+        if item.id in cache:
+            return cache[item.id]
         if 'REQUIRES' not in item.relations:
             return 0
 
         max_depth = 0
         for dep_id in item.relations['REQUIRES']:
             if dep_id in self.items:
-                dep_depth = self._get_dependency_depth(self.items[dep_id])
+                dep_depth = self._get_dependency_depth(self.items[dep_id], cache)
                 max_depth = max(max_depth, dep_depth + 1)
+        cache[item.id] = max_depth
         return max_depth
 
+    def _requires_path(self, start_id: str, goal_id: str) -> Optional[List[str]]:
+        """Find a chain of REQUIRES relations leading from start_id to goal_id.
+
+        Only items reachable from start_id are visited. Returns the IDs along
+        the chain, start and goal included, or None if there is none.
+        """
+        parents = {start_id: None}
+        stack = [start_id]
+        while stack:
+            node = stack.pop()
+            if node == goal_id:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                return path[::-1]
+            for target in self.items[node].relations.get('REQUIRES', []):
+                if target in self.items and target not in parents:
+                    parents[target] = node
+                    stack.append(target)
+        return None
+
     def insert_between(self, new_item: GianttItem, before_id: str, after_id: str):
         if before_id not in self.items or after_id not in self.items:
             raise ValueError("Both before and after items must exist")
@@ -722,6 +882,16 @@ class GianttGraph:
         before_item = self.items[before_id]
         after_item = self.items[after_id]
 
+        # If after_id has requirements, it will require the new item, which
+        # requires before_id, so this closes a cycle exactly when after_id is
+        # already reachable from before_id; checking that now only visits
+        # before_id's dependencies, and leaves the graph untouched if it fails.
+        # Otherwise nothing will require the new item, and no cycle can form
+        if 'REQUIRES' in after_item.relations:
+            path = self._requires_path(before_id, after_id)
+            if path:
+                raise CycleDetectedException([after_id, new_item.id] + path)
+
         # Update relations
         new_item.relations['REQUIRES'] = [before_id]
         new_item.relations['BLOCKS'] = [after_id]
@@ -760,6 +930,12 @@ class GianttGraph:
     def __add__(self, other: 'GianttGraph') -> 'GianttGraph':
         return self.plus(other)
 
+    def __iadd__(self, other: 'GianttGraph') -> 'GianttGraph':
+        """Merge other's items into this graph in place. Unlike +, items are
+        not copied, so other should not be used afterwards."""
+        self.items.update(other.items)
+        return self
+
 
 @dataclass
 class LogEntry:
@@ -770,6 +946,8 @@ class LogEntry:
     tags: Set[str]
     metadata: Dict[str, str] = field(default_factory=dict)
     occlude: bool = False
+    # Caches message_lower(), along with the message it came from
+    _message_lower: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def create(cls, session_tag: str, message: str, additional_tags: Optional[List[str]] = None, occlude: bool = False) -> 'LogEntry':
@@ -793,7 +971,7 @@ class LogEntry:
 
     def has_any_tags(self, tags: List[str]) -> bool:
         """Check if entry has any of the specified tags."""
-        return bool(self.tags.intersection(tags))
+        return not self.tags.isdisjoint(tags)
 
     def has_all_tags(self, tags: List[str]) -> bool:
         """Check if entry has all of the specified tags."""
@@ -807,6 +985,18 @@ class LogEntry:
         """Remove a tag from the entry."""
         self.tags.discard(tag)
 
+    def message_lower(self) -> str:
+        """Get the lowercased message, for case-insensitive searches.
+
+        It is cached along with the message it came from, so it is
+        recomputed only after the message is reassigned.
+        """
+        if self._message_lower is not None and self._message_lower[0] is self.message:
+            return self._message_lower[1]
+        lowered = self.message.lower()
+        self._message_lower = (self.message, lowered)
+        return lowered
+
     def set_occlude(self, occlude: bool) -> None:
         """Set the occlusion status of the entry."""
         self.occlude = occlude
@@ -827,7 +1017,7 @@ class LogEntry:
 
     def from_line(line: str, occlude: bool = False) -> 'LogEntry':
         """Create a LogEntry object from a jsonl line."""
-        data = json.loads(line)
+        data = json_loads(line)
         return LogEntry.from_dict(data, occlude)
 
     def to_dict(self) -> dict:
@@ -837,7 +1027,7 @@ class LogEntry:
             's': self.session,
             't': self.timestamp.isoformat(),
             'm': self.message,
-            'tags': sorted(list(self.tags)),
+            'tags': sorted(self.tags),
             'meta': self.metadata
         }
 
@@ -848,15 +1038,24 @@ class LogEntry:
 
 
 class LogCollection:
-    """A collection of log entries with query capabilities."""
+    """A collection of log entries with query capabilities.
+
+    Entries are kept in timestamp order, which insertion and date range
+    queries rely on; code editing entries directly should call sort() if
+    it might break that order.
+    """
 
     def __init__(self, entries: Optional[List[LogEntry]] = None):
         self.entries = entries or []
+        self.sort()
 
     def add_entry(self, entry: LogEntry) -> None:
-        """Add a new entry to the collection."""
+        """Add a new entry to the collection, keeping entries in timestamp order.
+
+        Entries with equal timestamps keep the order they were added in.
+        """
         index = self.get_first_index_after_timestamp(entry.timestamp)
-        self.entries.insert(index + 1, entry)
+        self.entries.insert(index, entry)
 
     def add_occlude_entry(self, entry: LogEntry) -> None:
         """Add a new entry to the collection ensuring occluded status."""
@@ -874,8 +1073,12 @@ class LogCollection:
         return entry
 
     def sort(self) -> None:
-        """Sort entries by timestamp."""
-        self.entries.sort(key=lambda e: e.timestamp)
+        """Sort entries by timestamp.
+
+        Timsort merges already-sorted runs in linear time, so sorting after
+        appending a sorted batch, as add_entries does, costs a single merge.
+        """
+        self.entries.sort(key=operator.attrgetter('timestamp'))
 
     def get_by_session(self, session_tag: str) -> List[LogEntry]:
         """Get all entries with a specific session tag."""
@@ -888,6 +1091,8 @@ class LogCollection:
             tags: List of tags to match
             require_all: If True, entries must have all tags; if False, any tag matches
         """
+        # Converted once, rather than by every entry's tag check below
+        tags = set(tags)
         if require_all:
             return [entry for entry in self.entries if entry.has_all_tags(tags)]
         return [entry for entry in self.entries if entry.has_any_tags(tags)]
@@ -895,40 +1100,46 @@ class LogCollection:
     def get_by_date_range(self, start: datetime, end: Optional[datetime] = None) -> List[LogEntry]:
         """Get entries within a date range."""
         end = end or datetime.now(timezone.utc)
-        return [
-            entry for entry in self.entries 
-            if start <= entry.timestamp <= end
-        ]
+        # Entries are in timestamp order, so the range is one contiguous slice
+        timestamp = operator.attrgetter('timestamp')
+        low = bisect.bisect_left(self.entries, start, key=timestamp)
+        high = bisect.bisect_right(self.entries, end, key=timestamp)
+        return self.entries[low:high]
 
     def get_by_substring(self, substring: str) -> List[LogEntry]:
         """Get entries with a specific substring in the message."""
-        return [entry for entry in self.entries if substring.lower() in entry.message.lower()]
+        substring_lower = substring.lower()
+        return [entry for entry in self.entries if substring_lower in entry.message_lower()]
 
     def get_first_index_after_timestamp(self, timestamp: datetime) -> int:
-        """Get the index of the first entry after a timestamp."""
-        if not self.entries:
-            return 0
-        if timestamp >= self.entries[-1].timestamp:
-            return len(self.entries) - 1
-        if timestamp < self.entries[0].timestamp:
-            return 0
-        low = 0
-        high = len(self.entries) - 1
-        while low < high:
-            mid = (low + high) // 2
-            if self.entries[mid].timestamp < timestamp:
-                low = mid + 1
+        """Get the index of the first entry after a timestamp.
+
+        Returns len(entries) if no entry is after it, so the result is
+        always where an entry with this timestamp belongs.
+        """
+        # New entries usually belong at the end, as when loading a log file
+        if not self.entries or timestamp >= self.entries[-1].timestamp:
+            return len(self.entries)
+        return bisect.bisect_right(self.entries, timestamp, key=operator.attrgetter('timestamp'))
+
+    def partition_by_occlude(self) -> Tuple[List[LogEntry], List[LogEntry]]:
+        """Split entries into those not occluded and those occluded, in one pass."""
+        included, occluded = [], []
+        include_append, occlude_append = included.append, occluded.append
+        for entry in self.entries:
+            if entry.occlude:
+                occlude_append(entry)
             else:
-                high = mid
-        return low
+                include_append(entry)
+        return included, occluded
 
     def include_entries(self) -> List[LogEntry]:
         """Get all entries that are not occluded."""
-        return [entry for entry in self.entries if not entry.occlude]
+        return self.partition_by_occlude()[0]
 
     def occluded_entries(self) -> List[LogEntry]:
         """Get all entries that are occluded."""
-        return [entry for entry in self.entries if entry.occlude]
+        return self.partition_by_occlude()[1]
 
     def __iter__(self):
         return iter(self.entries)
@@ -957,6 +1168,12 @@ class Issue:
     related_ids: List[str]
     suggested_fix: Optional[str] = None
 
+# The missing target's ID in a dangling reference issue's message
+DANGLING_TARGET_RE = re.compile(r"non-existent item '([^']+)'")
+
+# Relation names as they appear, lowercased, in issue messages
+RELATION_NAMES_LOWER = [(rel_name.lower(), rel_name) for rel_name in RelationType._member_names_]
+
 class GianttDoctor:
     def __init__(self, graph: 'GianttGraph'):
         self.graph = graph
@@ -984,24 +1201,33 @@ class GianttDoctor:
         """Get all issues of a specific type."""
         return [issue for issue in self.issues if issue.type == issue_type]
     
-    def fix_issues(self, issue_type: Optional[IssueType] = None, item_id: Optional[str] = None) -> List[Issue]:
-        """Fix issues of a specific type or for a specific item."""
+    def fix_issues(self, issue_type: Optional[IssueType] = None, item_id: Optional[str] = None,
+                   issues: Optional[List[Issue]] = None) -> List[Issue]:
+        """Fix issues of a specific type or for a specific item.
+
+        Callers that have already selected which of the diagnosed issues to
+        fix can pass them as issues, which skips filtering them again.
+        """
         # Filter issues to fix
-        issues_to_fix = self.issues
-        if issue_type:
-            issues_to_fix = [issue for issue in issues_to_fix if issue.type == issue_type]
-        if item_id:
-            issues_to_fix = [issue for issue in issues_to_fix if issue.item_id == item_id]
+        if issues is not None:
+            issues_to_fix = issues
+        else:
+            issues_to_fix = self.issues
+            if issue_type:
+                issues_to_fix = [issue for issue in issues_to_fix if issue.type == issue_type]
+            if item_id:
+                issues_to_fix = [issue for issue in issues_to_fix if issue.item_id == item_id]
             
         fixed = []
         for issue in issues_to_fix:
             if self._fix_issue(issue):
                 fixed.append(issue)
                 
-        # Remove fixed issues from the issues list
-        for issue in fixed:
-            if issue in self.issues:
-                self.issues.remove(issue)
+        # Remove fixed issues from the issues list in one pass, in place as
+        # callers may hold the list. Issues are matched by identity, since
+        # they aren't hashable and equal issues are interchangeable anyway
+        fixed_ids = {id(issue) for issue in fixed}
+        self.issues[:] = [issue for issue in self.issues if id(issue) not in fixed_ids]
                 
         self.fixed_issues.extend(fixed)
         return fixed
@@ -1024,8 +1250,9 @@ class GianttDoctor:
         # Find the relation type and target from the message
         rel_type = None
         target = None
-        for rel_name in RelationType._member_names_:
-            if rel_name.lower() in issue.message.lower():
+        message_lower = issue.message.lower()
+        for rel_name_lower, rel_name in RELATION_NAMES_LOWER:
+            if rel_name_lower in message_lower:
                 rel_type = rel_name
                 break
                 
@@ -1033,8 +1260,7 @@ class GianttDoctor:
             return False
             
         # Extract the target ID from the message
-        import re
-        match = re.search(r"non-existent item '([^']+)'", issue.message)
+        match = DANGLING_TARGET_RE.search(issue.message)
         if not match:
             return False
             
@@ -1100,13 +1326,14 @@ class GianttDoctor:
 
     def _check_orphans(self):
         """Find items with no incoming or outgoing relations."""
+        # Every ID some item has a relation to, collected once up front
+        incoming = set()
+        for other in self.graph.items.values():
+            for targets in other.relations.values():
+                incoming.update(targets)
+
         for item_id, item in self.graph.items.items():
-            has_incoming = any(
-                target == item_id
-                for other in self.graph.items.values()
-                for targets in other.relations.values()
-                for target in targets
-            )
+            has_incoming = item_id in incoming
             has_outgoing = bool(item.relations)
 
             if not has_incoming and not has_outgoing:
@@ -1120,26 +1347,14 @@ class GianttDoctor:
 
     def _check_chains(self):
         """Check for incomplete dependency chains."""
-        blocks_map = {
-            item_id: set(targets)
-            for item_id, item in self.graph.items.items()
-            for targets in [item.relations.get('BLOCKS', [])]
-        }
-        requires_map = {
-            item_id: set(targets)
-            for item_id, item in self.graph.items.items()
-            for targets in [item.relations.get('REQUIRES', [])]
-        }
-        sufficient_map = {
-            item_id: set(targets)
-            for item_id, item in self.graph.items.items()
-            for targets in [item.relations.get('SUFFICIENT', [])]
-        }
-        anyof_map = {
-            item_id: set(targets)
-            for item_id, item in self.graph.items.items()
-            for targets in [item.relations.get('ANY', [])]
-        }
+        # Build all four relation maps in one pass over the items
+        blocks_map, requires_map, sufficient_map, anyof_map = {}, {}, {}, {}
+        for item_id, item in self.graph.items.items():
+            relations = item.relations
+            blocks_map[item_id] = set(relations.get('BLOCKS', ()))
+            requires_map[item_id] = set(relations.get('REQUIRES', ()))
+            sufficient_map[item_id] = set(relations.get('SUFFICIENT', ()))
+            anyof_map[item_id] = set(relations.get('ANY', ()))
 
         # Check for items that block something but aren't required by it or vice versa
         for item_id, blocks_items in blocks_map.items():
@@ -1190,30 +1405,27 @@ class GianttDoctor:
 
     def _check_charts(self):
         """Check for chart consistency issues."""
-        # Find all unique charts
-        all_charts = set()
-        chart_items: Dict[str, Set[str]] = {}
+        # Find all unique charts, and the items with each
+        chart_items: Dict[str, Set[str]] = defaultdict(set)
 
         for item_id, item in self.graph.items.items():
             for chart in item.charts:
-                all_charts.add(chart)
-                if chart not in chart_items:
-                    chart_items[chart] = set()
                 chart_items[chart].add(item_id)
 
+        # Each item's charts as a set, for membership checks below
+        chart_sets = {item_id: frozenset(item.charts) for item_id, item in self.graph.items.items()}
+
         # Check for items that should probably be in certain charts
-        for chart in all_charts:
-            chart_set = chart_items[chart]
+        for chart, chart_set in chart_items.items():
             for item_id in chart_set:
                 item = self.graph.items[item_id]
                 # Check if any required items or blocked items in this chart
                 # aren't also in this chart
                 related_items = set(item.relations.get('REQUIRES', []) + 
                                  item.relations.get('BLOCKS', []))
-                for related_id in related_items:
-                    if (related_id in self.graph.items and 
-                        related_id not in chart_set and
-                        any(c == chart for c in self.graph.items[related_id].charts)):
+                for related_id in related_items - chart_set:
+                    if (related_id in self.graph.items and
+                        chart in chart_sets[related_id]):
                         self.issues.append(Issue(
                             type=IssueType.CHART_INCONSISTENCY,
                             item_id=related_id,
@@ -1224,29 +1436,26 @@ class GianttDoctor:
 
     def _check_tags(self):
         """Check for tag consistency issues."""
-        # Find all unique tags
-        all_tags = set()
-        tag_items: Dict[str, Set[str]] = {}
+        # Find all unique tags, and the items with each
+        tag_items: Dict[str, Set[str]] = defaultdict(set)
 
         for item_id, item in self.graph.items.items():
             for tag in item.tags:
-                all_tags.add(tag)
-                if tag not in tag_items:
-                    tag_items[tag] = set()
                 tag_items[tag].add(item_id)
 
+        # Each item's tags as a set, for membership checks below
+        tag_sets = {item_id: frozenset(item.tags) for item_id, item in self.graph.items.items()}
+
         # Check for items that should probably have certain tags
-        for tag in all_tags:
-            tag_set = tag_items[tag]
+        for tag, tag_set in tag_items.items():
             for item_id in tag_set:
                 item = self.graph.items[item_id]
                 # Check if any required items with this tag aren't also tagged
                 related_items = set(item.relations.get('REQUIRES', []) + 
                                  item.relations.get('BLOCKS', []))
-                for related_id in related_items:
-                    if (related_id in self.graph.items and 
-                        related_id not in tag_set and
-                        any(t == tag for t in self.graph.items[related_id].tags)):
+                for related_id in related_items - tag_set:
+                    if (related_id in self.graph.items and
+                        tag in tag_sets[related_id]):
                         self.issues.append(Issue(
                             type=IssueType.TAG_INCONSISTENCY,
                             item_id=related_id,
@@ -0,0 +1,89 @@
+"""Tests for giantt_core. Run with: python -m unittest test_giantt_core"""
+import math
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from giantt_core import (
+    GianttGraph, GianttItem, Status, Priority, Duration,
+    LogEntry, LogCollection, CycleDetectedException
+)
+
+
+def make_graph(*lines: str) -> GianttGraph:
+    graph = GianttGraph()
+    for line in lines:
+        graph.add_item(GianttItem.from_string(line))
+    return graph
+
+def log_entry(session: str, seconds: int, *tags: str) -> LogEntry:
+    return LogEntry(session, datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds),
+                    f"{session} at {seconds}", {session, *tags})
+
+def new_item(id: str) -> GianttItem:
+    return GianttItem(id, "New", "", Status.NOT_STARTED, Priority.NEUTRAL, Duration.parse('1d'),
+                      ["C"], [], {}, None, None, None)
+
+
+class InsertBetweenTest(unittest.TestCase):
+    def test_after_without_requires(self):
+        graph = make_graph('○ after 1d "After" {"C"}',
+                           '○ before 1d "Before" {"C"} >>> ⊢[after]')
+        graph.insert_between(new_item('new'), 'before', 'after')
+        self.assertEqual([item.id for item in graph.topological_sort()], ['after', 'before', 'new'])
+
+    def test_cycle_leaves_graph_untouched(self):
+        graph = make_graph('○ z 1d "Z" {"C"}',
+                           '○ after 1d "After" {"C"} >>> ⊢[z]',
+                           '○ before 1d "Before" {"C"} >>> ⊢[after]')
+        with self.assertRaises(CycleDetectedException):
+            graph.insert_between(new_item('new'), 'before', 'after')
+        self.assertNotIn('new', graph.items)
+        self.assertEqual(graph.items['after'].relations, {'REQUIRES': ['z']})
+
+
+class LogEntryLineTest(unittest.TestCase):
+    def test_round_trip_values_json_dumps_writes(self):
+        entry = LogEntry('s1', datetime(2025, 1, 1, tzinfo=timezone.utc), "m", {'s1'},
+                         metadata={'nan': math.nan, 'inf': -math.inf, 'big': 123456789012345678901234567890,
+                                   'small': -9223372036854775809})
+        parsed = LogEntry.from_line(entry.to_line())
+        self.assertTrue(math.isnan(parsed.metadata['nan']))
+        self.assertEqual(parsed.metadata['inf'], -math.inf)
+        self.assertEqual(parsed.metadata['big'], 123456789012345678901234567890)
+        self.assertEqual(parsed.metadata['small'], -9223372036854775809)
+        self.assertEqual(parsed.to_line(), entry.to_line())
+
+
+class LogCollectionTest(unittest.TestCase):
+    def test_queries_see_entry_and_list_changes(self):
+        logs = LogCollection()
+        first, second = log_entry('s1', 0, 'a'), log_entry('s2', 1)
+        logs.add_entry(first)
+        logs.add_entry(second)
+        self.assertEqual(logs.get_by_tags(['a']), [first])
+        second.add_tag('a')
+        first.remove_tag('a')
+        self.assertEqual(logs.get_by_tags(['a']), [second])
+        third = log_entry('s1', 2)
+        logs.entries.append(third)
+        self.assertEqual(logs.get_by_session('s1'), [first, third])
+
+    def test_date_range_with_unsorted_input(self):
+        entries = [log_entry('s1', seconds) for seconds in (5, 1, 9, 3, 7)]
+        logs = LogCollection(list(entries))
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        in_range = logs.get_by_date_range(start + timedelta(seconds=2), start + timedelta(seconds=7))
+        self.assertEqual([entry.message for entry in in_range], ['s1 at 3', 's1 at 5', 's1 at 7'])
+
+    def test_add_and_range_after_direct_append(self):
+        logs = LogCollection([log_entry('s1', 0), log_entry('s1', 2)])
+        logs.entries.append(log_entry('s1', 4))
+        logs.add_entry(log_entry('s2', 3))
+        self.assertEqual([entry.message for entry in logs.entries],
+                         ['s1 at 0', 's1 at 2', 's2 at 3', 's1 at 4'])
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual(len(logs.get_by_date_range(start + timedelta(seconds=3))), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()